@@ -22,6 +22,10 @@ class DesignController:
         """Get all designs"""
         return self.manager.get_all_designs()
 
+    def get_designs_for_requirement(self, requirement_id: str) -> List[Design]:
+        """Get all designs linked to a requirement"""
+        return self.manager.get_designs_for_requirement(requirement_id)
+
     def update_design(self, design: Design) -> Design:
         """Update an existing design"""
         return self.manager.update_design(design)
@@ -29,3 +33,7 @@ class DesignController:
     def delete_design(self, design_id: int) -> bool:
         """Delete a design"""
         return self.manager.delete_design(design_id)
+
+    def delete_designs(self, design_ids: List[int]) -> int:
+        """Delete several designs at once"""
+        return self.manager.delete_many(design_ids)
@@ -1,30 +1,55 @@
-from typing import List, Optional, Dict, Any, Callable
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any
+from PyQt6.QtCore import QObject, pyqtSignal
 from managers.requirement_manager import RequirementManager
-from models.requirement import Requirement
-from exceptions import ValidationError, DatabaseError, EntityNotFoundError
+from models.requirement import Requirement, RequirementSummary
+from exceptions import ValidationError, DatabaseError
 
 
-class RequirementController:
+class RequirementController(QObject):
     """Controller for requirement operations"""
 
-    def __init__(self, manager: RequirementManager):
+    data_changed = pyqtSignal()  # Emitted after requirements are modified
+
+    def __init__(self, manager: RequirementManager, parent=None):
         """
         Initialize controller
 
         Args:
             manager: Requirement manager
+            parent: Parent object
         """
+        super().__init__(parent)
         self.manager = manager
-        self._observers: List[Callable] = []
+        self._batch_depth = 0
+        self._batch_changed = False
+
+    def begin_batch(self):
+        """Suppress change notifications until the matching end_batch"""
+        self._batch_depth += 1
 
-    def add_observer(self, observer: Callable):
-        """Add observer for data changes"""
-        self._observers.append(observer)
+    def end_batch(self):
+        """Finish a batch, emitting one change notification if needed"""
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_changed:
+            self._batch_changed = False
+            self.data_changed.emit()
 
-    def notify_observers(self):
-        """Notify all observers of data changes"""
-        for observer in self._observers:
-            observer()
+    @contextmanager
+    def batch(self):
+        """Context manager grouping several operations into one notification"""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def _notify_changed(self):
+        """Notify listeners of data changes"""
+        if self._batch_depth:
+            self._batch_changed = True
+        else:
+            self.data_changed.emit()
 
     def create_requirement(self, data: Dict[str, Any]) -> tuple[bool, str, Optional[Requirement]]:
         """
@@ -37,15 +62,36 @@ class RequirementController:
             Tuple of (success, message, requirement)
         """
         try:
-            requirement = self.manager.create_requirement(data)
-            self.notify_observers()
-            return True, f"Requirement {requirement.id} created successfully", requirement
-        except ValidationError as e:
-            return False, str(e), None
+            result = self.manager.create_requirement(data)
         except DatabaseError as e:
             return False, f"Database error: {str(e)}", None
         except Exception as e:
             return False, f"Unexpected error: {str(e)}", None
+        if result.ok:
+            self._notify_changed()
+        return result.ok, result.message, result.entity
+
+    def create_requirements(self, data_list: List[Dict[str, Any]]) -> tuple[bool, str, List[Requirement]]:
+        """
+        Create several requirements in one transaction
+
+        Args:
+            data_list: List of requirement data
+
+        Returns:
+            Tuple of (success, message, requirements)
+        """
+        try:
+            requirements = self.manager.create_many(data_list)
+        except ValidationError as e:
+            return False, str(e), []
+        except DatabaseError as e:
+            return False, f"Database error: {str(e)}", []
+        except Exception as e:
+            return False, f"Unexpected error: {str(e)}", []
+        if requirements:
+            self._notify_changed()
+        return True, f"{len(requirements)} requirements created successfully", requirements
 
     def update_requirement(self, req_id: str, data: Dict[str, Any]) -> tuple[bool, str, Optional[Requirement]]:
         """
@@ -59,24 +105,21 @@ class RequirementController:
             Tuple of (success, message, requirement)
         """
         try:
-            requirement = self.manager.update_requirement(req_id, data)
-            self.notify_observers()
-            return True, f"Requirement {req_id} updated successfully", requirement
-        except EntityNotFoundError as e:
-            return False, str(e), None
-        except ValidationError as e:
-            return False, str(e), None
+            result = self.manager.update_requirement(req_id, data)
         except DatabaseError as e:
             return False, f"Database error: {str(e)}", None
         except Exception as e:
             return False, f"Unexpected error: {str(e)}", None
+        if result.ok:
+            self._notify_changed()
+        return result.ok, result.message, result.entity
 
     def delete_requirement(self, req_id: str) -> tuple[bool, str]:
         """Delete requirement"""
         try:
             success = self.manager.delete_requirement(req_id)
             if success:
-                self.notify_observers()
+                self._notify_changed()
                 return True, f"Requirement {req_id} deleted successfully"
             return False, f"Requirement {req_id} not found"
         except DatabaseError as e:
@@ -84,10 +127,15 @@ class RequirementController:
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
 
-    def get_all_requirements(self) -> List[Requirement]:
-        """Get all requirements"""
-        return self.manager.get_all_requirements()
+    def get_all_requirements(self, order_by: Optional[str] = 'id',
+                             load_links: bool = True) -> List[Requirement]:
+        """Get all requirements, sorted by order_by unless it is None"""
+        return self.manager.get_all_requirements(order_by, load_links)
+
+    def get_requirement_summaries(self) -> List[RequirementSummary]:
+        """Get lightweight summaries of all requirements"""
+        return self.manager.get_requirement_summaries()
 
-    def search_requirements(self, query: str) -> List[Requirement]:
+    def search_requirements(self, query: str, load_links: bool = True) -> List[Requirement]:
         """Search requirements"""
-        return self.manager.search_requirements(query)
+        return self.manager.search_requirements(query, load_links)
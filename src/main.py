@@ -1,4 +1,5 @@
 import sys
+import threading
 from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget
 from repositories.sqlite_repository import SQLiteRequirementRepository
 from repositories.sqlite_design_repository import SQLiteDesignRepository
@@ -10,6 +11,8 @@ from ui.views.requirements_view import RequirementsView
 from ui.views.designs_view import DesignsView
 from ui.views.toolbar import ToolBar
 from ui.views.tabbar import TabBar
+from ui.views.lazy_tab_widget import LazyTabWidget
+from ui.widgets.markdown_renderer import prewarm_renderer
 
 
 class MainWindow(QMainWindow):
@@ -24,13 +27,13 @@ class MainWindow(QMainWindow):
         db_path = "dragon_alm.db"
 
         # Requirements
-        req_repository = SQLiteRequirementRepository(db_path)
-        req_manager = RequirementManager(req_repository)
+        self.req_repository = SQLiteRequirementRepository(db_path)
+        req_manager = RequirementManager(self.req_repository)
         req_controller = RequirementController(req_manager)
 
         # Design
-        design_repository = SQLiteDesignRepository(db_path)
-        design_manager = DesignManager(design_repository)
+        self.design_repository = SQLiteDesignRepository(db_path)
+        design_manager = DesignManager(self.design_repository)
         design_controller = DesignController(design_manager)
         
         # Create Toolbar
@@ -39,22 +42,27 @@ class MainWindow(QMainWindow):
         self.addToolBar(toolbar)
 
         # Create tab widget with custom tab bar
-        tabs = QTabWidget()
+        tabs = LazyTabWidget()
         tabs.setTabBar(TabBar())
 
-        # Create views
-        requirements_view = RequirementsView(req_controller, design_controller)
-        tabs.addTab(requirements_view, "Requirements")
-
-        designs_view = DesignsView(design_controller, req_controller)
-        tabs.addTab(designs_view, "Design")
+        # Create views; each is built when its tab is first shown
+        tabs.add_lazy_tab(
+            lambda: RequirementsView(req_controller, design_controller), "Requirements")
+        tabs.add_lazy_tab(
+            lambda: DesignsView(design_controller, req_controller), "Design")
 
         # Add placeholder tabs
-        tabs.addTab(QTabWidget(), "Implementation")
-        tabs.addTab(QTabWidget(), "Traceability")
+        tabs.add_lazy_tab(QTabWidget, "Implementation")
+        tabs.add_lazy_tab(QTabWidget, "Traceability")
 
         self.setCentralWidget(tabs)
 
+    def closeEvent(self, event):
+        """Release database connections on shutdown"""
+        self.req_repository.close()
+        self.design_repository.close()
+        super().closeEvent(event)
+
 def main():
     app = QApplication(sys.argv)
 
@@ -64,6 +72,9 @@ def main():
     window = MainWindow()
     window.show()
 
+    # Load the Markdown libraries in the background while the window is idle
+    threading.Thread(target=prewarm_renderer, daemon=True).start()
+
     sys.exit(app.exec())
 
 
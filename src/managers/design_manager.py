@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from models.design import Design
 from repositories.sqlite_design_repository import SQLiteDesignRepository
 
@@ -26,6 +26,24 @@ class DesignManager:
         )
         return self.repository.create(design)
 
+    def create_many(self, data_list: List[Dict[str, Any]]) -> List[Design]:
+        """Create several designs in a single transaction"""
+        now = datetime.now()
+        designs = [
+            Design(
+                id=None,
+                name=data['name'],
+                description=data['description'],
+                type=data['type'],
+                status=data.get('status', "Draft"),
+                created_at=now,
+                updated_at=now,
+                requirement_ids=data.get('requirement_ids') or []
+            )
+            for data in data_list
+        ]
+        return self.repository.create_many(designs)
+
     def get_design(self, design_id: int) -> Optional[Design]:
         """Get a design by ID"""
         return self.repository.get(design_id)
@@ -34,6 +52,10 @@ class DesignManager:
         """Get all designs"""
         return self.repository.get_all()
 
+    def get_designs_for_requirement(self, requirement_id: str) -> List[Design]:
+        """Get all designs linked to a requirement"""
+        return self.repository.get_by_requirement(requirement_id)
+
     def update_design(self, design: Design) -> Design:
         """Update an existing design"""
         design.updated_at = datetime.now()
@@ -43,6 +65,10 @@ class DesignManager:
         """Delete a design"""
         return self.repository.delete(design_id)
 
+    def delete_many(self, design_ids: List[int]) -> int:
+        """Delete several designs in a single transaction"""
+        return self.repository.delete_many(design_ids)
+
     def get_design_types(self) -> List[str]:
         """Get available design types"""
         return ["Architecture", "Component", "Interface", "Database", "Algorithm", "Security"]
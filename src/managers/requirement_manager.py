@@ -1,7 +1,8 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
-from models.requirement import Requirement
-from models.enums import RequirementStatus, Priority
+from models.requirement import Requirement, RequirementSummary
+from models.enums import RequirementStatus, Priority, STATUS_BY_VALUE, PRIORITY_BY_VALUE
+from models.result import Result
 from repositories.sqlite_repository import SQLiteRequirementRepository
 from services.validation_service import ValidationService
 from exceptions import ValidationError, EntityNotFoundError
@@ -20,7 +21,7 @@ class RequirementManager:
         self.repository = repository
         self.validation_service = ValidationService()
 
-    def create_requirement(self, data: Dict[str, Any]) -> Requirement:
+    def create_requirement(self, data: Dict[str, Any]) -> Result[Requirement]:
         """
         Create new requirement
 
@@ -28,28 +29,82 @@ class RequirementManager:
             data: Requirement data dictionary
 
         Returns:
-            Created requirement
-
-        Raises:
-            ValidationError: If validation fails
+            Result holding the created requirement, or the validation
+            failure message
         """
         # Generate ID if not provided
         if 'id' not in data or not data['id']:
             data['id'] = self.repository.get_next_id()
 
+        requirement = self._build_requirement(data)
+
+        # Validate
+        validation_result = self.validation_service.validate_requirement(requirement)
+        if not validation_result.valid:
+            return Result(False, f"Validation failed: {', '.join(validation_result.errors)}")
+
+        # Save to repository
+        self.repository.create(requirement)
+
+        return Result(True, f"Requirement {requirement.id} created successfully", requirement)
+
+    def create_many(self, data_list: List[Dict[str, Any]]) -> List[Requirement]:
+        """
+        Create several requirements in one repository transaction
+
+        All requirements are validated before anything is written, so
+        either every requirement is stored or none is.
+
+        Args:
+            data_list: List of requirement data dictionaries
+
+        Returns:
+            Created requirements
+
+        Raises:
+            ValidationError: If validation of any requirement fails
+        """
+        next_number = None
+        requirements = []
+        errors = []
+        for data in data_list:
+            # Generate sequential IDs for entries without one
+            if 'id' not in data or not data['id']:
+                if next_number is None:
+                    next_number = int(self.repository.get_next_id().split('-')[1])
+                data['id'] = f"REQ-{next_number:03d}"
+                next_number += 1
+
+            requirement = self._build_requirement(data)
+            validation_result = self.validation_service.validate_requirement(requirement)
+            if not validation_result.valid:
+                errors.append(f"{requirement.id}: {', '.join(validation_result.errors)}")
+            requirements.append(requirement)
+
+        if errors:
+            raise ValidationError(f"Validation failed: {'; '.join(errors)}")
+
+        if requirements:
+            self.repository.create_many(requirements)
+
+        return requirements
+
+    def _build_requirement(self, data: Dict[str, Any]) -> Requirement:
+        """Build a new requirement object from data, applying defaults"""
         # Set defaults
         if 'status' not in data:
             data['status'] = RequirementStatus.DRAFT
         elif isinstance(data['status'], str):
-            data['status'] = RequirementStatus(data['status'])
+            data['status'] = STATUS_BY_VALUE.get(data['status'], data['status'])
 
         if 'priority' not in data:
             data['priority'] = Priority.MEDIUM
         elif isinstance(data['priority'], str):
-            data['priority'] = Priority(data['priority'])
+            data['priority'] = PRIORITY_BY_VALUE.get(data['priority'], data['priority'])
 
         # Create requirement object
-        requirement = Requirement(
+        now = datetime.now()
+        return Requirement(
             id=data['id'],
             title=data.get('title', ''),
             description=data.get('description', ''),
@@ -59,52 +114,83 @@ class RequirementManager:
             parent_id=data.get('parent_id'),
             verification_criteria=data.get('verification_criteria', ''),
             design_ids=data.get('design_ids', []),
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
 
+    def update_requirement(self, req_id: str, data: Dict[str, Any]) -> Result[Requirement]:
+        """
+        Update existing requirement
+
+        Args:
+            req_id: Requirement ID
+            data: Updated data
+
+        Returns:
+            Result holding the updated requirement, or the reason the
+            requirement was not found or failed validation
+        """
+        requirement = self.repository.read(req_id)
+        if requirement is None:
+            return Result(False, f"Requirement {req_id} not found")
+
+        self._apply_updates(requirement, data)
+
         # Validate
         validation_result = self.validation_service.validate_requirement(requirement)
         if not validation_result.valid:
-            raise ValidationError(
-                f"Validation failed: {', '.join(validation_result.errors)}"
-            )
+            return Result(False, f"Validation failed: {', '.join(validation_result.errors)}")
 
-        # Save to repository
-        self.repository.create(requirement)
+        # Update in repository
+        self.repository.update(requirement)
 
-        return requirement
+        return Result(True, f"Requirement {req_id} updated successfully", requirement)
 
-    def update_requirement(self, req_id: str, data: Dict[str, Any]) -> Requirement:
+    def update_many(self, updates: Dict[str, Dict[str, Any]]) -> List[Requirement]:
         """
-        Update existing requirement
+        Update several requirements in one repository transaction
 
         Args:
-            req_id: Requirement ID
-            data: Updated data
+            updates: Mapping of requirement ID to updated data
 
         Returns:
-            Updated requirement
+            Updated requirements
 
         Raises:
-            EntityNotFoundError: If requirement not found
-            ValidationError: If validation fails
+            EntityNotFoundError: If any requirement is not found
+            ValidationError: If validation of any requirement fails
         """
-        requirement = self.repository.read(req_id)
-        if requirement is None:
-            raise EntityNotFoundError(f"Requirement {req_id} not found")
+        requirements = []
+        errors = []
+        for req_id, data in updates.items():
+            requirement = self.repository.read(req_id)
+            if requirement is None:
+                raise EntityNotFoundError(f"Requirement {req_id} not found")
+
+            self._apply_updates(requirement, data)
+            validation_result = self.validation_service.validate_requirement(requirement)
+            if not validation_result.valid:
+                errors.append(f"{req_id}: {', '.join(validation_result.errors)}")
+            requirements.append(requirement)
 
-        # Update fields
+        if errors:
+            raise ValidationError(f"Validation failed: {'; '.join(errors)}")
+
+        if requirements:
+            self.repository.update_many(requirements)
+
+        return requirements
+
+    def _apply_updates(self, requirement: Requirement, data: Dict[str, Any]):
+        """Apply updated data fields to a requirement"""
         if 'title' in data:
             requirement.title = data['title']
         if 'description' in data:
             requirement.description = data['description']
         if 'status' in data:
-            requirement.status = RequirementStatus(data['status']) \
-                if isinstance(data['status'], str) else data['status']
+            requirement.status = STATUS_BY_VALUE.get(data['status'], data['status'])
         if 'priority' in data:
-            requirement.priority = Priority(data['priority']) \
-                if isinstance(data['priority'], str) else data['priority']
+            requirement.priority = PRIORITY_BY_VALUE.get(data['priority'], data['priority'])
         if 'category' in data:
             requirement.category = data['category']
         if 'parent_id' in data:
@@ -116,18 +202,6 @@ class RequirementManager:
 
         requirement.updated_at = datetime.now()
 
-        # Validate
-        validation_result = self.validation_service.validate_requirement(requirement)
-        if not validation_result.valid:
-            raise ValidationError(
-                f"Validation failed: {', '.join(validation_result.errors)}"
-            )
-
-        # Update in repository
-        self.repository.update(requirement)
-
-        return requirement
-
     def delete_requirement(self, req_id: str) -> bool:
         """Delete requirement by ID"""
         return self.repository.delete(req_id)
@@ -136,21 +210,23 @@ class RequirementManager:
         """Get requirement by ID"""
         return self.repository.read(req_id)
 
-    def get_all_requirements(self) -> List[Requirement]:
-        """Get all requirements"""
-        return self.repository.find_all()
-
-    def search_requirements(self, query: str) -> List[Requirement]:
-        """Search requirements by title or description"""
-        all_reqs = self.repository.find_all()
-        query_lower = query.lower()
-        return [
-            req for req in all_reqs
-            if query_lower in req.title.lower()
-            or query_lower in req.description.lower()
-            or query_lower in req.id.lower()
-        ]
+    def get_all_requirements(self, order_by: Optional[str] = 'id',
+                             load_links: bool = True) -> List[Requirement]:
+        """Get all requirements, sorted by order_by unless it is None"""
+        return self.repository.find_all(order_by, load_links)
+
+    def iter_requirements(self, load_links: bool = True) -> Iterator[Requirement]:
+        """Iterate over all requirements in ID order, fetching them in batches"""
+        return self.repository.iter_all(load_links=load_links)
+
+    def get_requirement_summaries(self) -> List[RequirementSummary]:
+        """Get lightweight summaries of all requirements"""
+        return self.repository.find_summaries()
+
+    def search_requirements(self, query: str, load_links: bool = True) -> List[Requirement]:
+        """Search requirements by ID, title or description"""
+        return self.repository.search(query, load_links)
 
     def get_children(self, parent_id: str) -> List[Requirement]:
         """Get child requirements"""
-        return self.repository.find_by_criteria({'parent_id': parent_id})
+        return self.repository.get_children_of(parent_id)
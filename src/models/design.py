@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Design:
     """Design item model"""
     id: Optional[int]
@@ -13,8 +13,4 @@ class Design:
     status: str  # e.g., "Draft", "In Review", "Approved", "Implemented"
     created_at: datetime
     updated_at: datetime
-    requirement_ids: list[int]  # Linked requirements
-
-    def __post_init__(self):
-        if self.requirement_ids is None:
-            self.requirement_ids = []
+    requirement_ids: list[int] = field(default_factory=list)  # Linked requirements
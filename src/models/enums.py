@@ -34,6 +34,11 @@ class Priority(Enum):
     CRITICAL = "Critical"
 
 
+# Value-to-member lookups, cheaper than calling the enum class
+STATUS_BY_VALUE = {status.value: status for status in RequirementStatus}
+PRIORITY_BY_VALUE = {priority.value: priority for priority in Priority}
+
+
 class LinkType(Enum):
     """Trace link types"""
     REQ_TO_DES = "req_to_des"
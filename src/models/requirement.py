@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any
 from models.enums import RequirementStatus, Priority
 
 
-@dataclass
+@dataclass(slots=True)
 class Requirement:
     """Requirement domain model"""
     id: str
@@ -74,3 +74,14 @@ class Requirement:
     def __repr__(self) -> str:
         return (f"Requirement(id='{self.id}', title='{self.title}', "
                 f"status={self.status.value}, priority={self.priority.value})")
+
+
+@dataclass(slots=True)
+class RequirementSummary:
+    """Lightweight requirement projection for lists and pickers"""
+    id: str
+    title: str
+    status: RequirementStatus
+    priority: Priority
+    category: str
+    parent_id: Optional[str] = None
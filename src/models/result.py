@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(slots=True)
+class Result(Generic[T]):
+    """Outcome of a manager operation"""
+    ok: bool
+    message: str
+    entity: Optional[T] = None
+
+    def __bool__(self) -> bool:
+        return self.ok
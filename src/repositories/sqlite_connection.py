@@ -0,0 +1,24 @@
+import sqlite3
+
+
+def configure_connection(conn: sqlite3.Connection):
+    """
+    Apply performance PRAGMAs to a SQLite connection
+
+    WAL lets readers proceed while a write is in progress and, with
+    synchronous=NORMAL, only syncs on checkpoints instead of every commit.
+    A busy timeout makes a connection wait for a lock held by another
+    one instead of failing immediately with "database is locked".
+
+    Args:
+        conn: Connection to configure
+    """
+    # WAL needs a database file; in-memory databases keep their journal mode
+    main_db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    if main_db_file:
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA busy_timeout=5000")
@@ -1,7 +1,49 @@
 import sqlite3
+import threading
 from datetime import datetime
 from typing import List, Optional
 from models.design import Design
+from repositories.sqlite_connection import configure_connection
+
+# Statements are kept as constants so the persistent connection's
+# statement cache is hit on every call
+_SQL_INSERT = """
+    INSERT INTO designs (name, description, type, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_LINK = """
+    INSERT INTO design_requirements (design_id, requirement_id)
+    VALUES (?, ?)
+"""
+_SQL_GET = """
+    SELECT d.id, d.name, d.description, d.type, d.status, d.created_at, d.updated_at,
+           dr.requirement_id
+    FROM designs d
+    LEFT JOIN design_requirements dr ON dr.design_id = d.id
+    WHERE d.id = ?
+"""
+_SQL_GET_ALL = """
+    SELECT d.id, d.name, d.description, d.type, d.status, d.created_at, d.updated_at,
+           dr.requirement_id
+    FROM designs d
+    LEFT JOIN design_requirements dr ON dr.design_id = d.id
+    ORDER BY d.id
+"""
+_SQL_GET_BY_REQUIREMENT = """
+    SELECT d.id, d.name, d.description, d.type, d.status, d.created_at, d.updated_at,
+           dr.requirement_id
+    FROM designs d
+    LEFT JOIN design_requirements dr ON dr.design_id = d.id
+    WHERE d.id IN (SELECT design_id FROM design_requirements WHERE requirement_id = ?)
+    ORDER BY d.id
+"""
+_SQL_UPDATE = """
+    UPDATE designs SET name = ?, description = ?, type = ?, status = ?, updated_at = ?
+    WHERE id = ?
+"""
+_SQL_GET_LINKS = "SELECT requirement_id FROM design_requirements WHERE design_id = ?"
+_SQL_DELETE_LINK = "DELETE FROM design_requirements WHERE design_id = ? AND requirement_id = ?"
+_SQL_DELETE = "DELETE FROM designs WHERE id = ?"
 
 
 class SQLiteDesignRepository:
@@ -9,11 +51,19 @@ class SQLiteDesignRepository:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._init_db()
 
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
+            configure_connection(conn)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS designs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -34,103 +84,128 @@ class SQLiteDesignRepository:
                     FOREIGN KEY (requirement_id) REFERENCES requirements(id) ON DELETE CASCADE
                 )
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_dr_req
+                ON design_requirements(requirement_id)
+            """)
             conn.commit()
 
     def create(self, design: Design) -> Design:
         """Create a new design"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO designs (name, description, type, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (design.name, design.description, design.type, design.status,
+        with self._lock, self._conn as conn:
+            cursor = conn.execute(_SQL_INSERT, (design.name, design.description, design.type, design.status,
                   design.created_at.isoformat(), design.updated_at.isoformat()))
             design.id = cursor.lastrowid
 
             # Insert requirement links
             if design.requirement_ids:
-                conn.executemany("""
-                    INSERT INTO design_requirements (design_id, requirement_id)
-                    VALUES (?, ?)
-                """, [(design.id, req_id) for req_id in design.requirement_ids])
+                conn.executemany(_SQL_INSERT_LINK,
+                                 [(design.id, req_id) for req_id in design.requirement_ids])
 
             conn.commit()
         return design
 
+    def create_many(self, designs: List[Design]) -> List[Design]:
+        """Create several designs in a single transaction"""
+        with self._lock, self._conn as conn:
+            links = []
+            for design in designs:
+                cursor = conn.execute(_SQL_INSERT, (design.name, design.description, design.type, design.status,
+                      design.created_at.isoformat(), design.updated_at.isoformat()))
+                design.id = cursor.lastrowid
+                links.extend((design.id, req_id) for req_id in design.requirement_ids)
+
+            # Insert requirement links
+            if links:
+                conn.executemany(_SQL_INSERT_LINK, links)
+
+            conn.commit()
+        return designs
+
     def get(self, design_id: int) -> Optional[Design]:
         """Get a design by ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute("""
-                SELECT * FROM designs WHERE id = ?
-            """, (design_id,)).fetchone()
-
-            if not row:
-                return None
-
-            # Get linked requirements
-            req_rows = conn.execute("""
-                SELECT requirement_id FROM design_requirements WHERE design_id = ?
-            """, (design_id,)).fetchall()
-            requirement_ids = [r['requirement_id'] for r in req_rows]
-
-            return Design(
-                id=row['id'],
-                name=row['name'],
-                description=row['description'],
-                type=row['type'],
-                status=row['status'],
-                created_at=datetime.fromisoformat(row['created_at']),
-                updated_at=datetime.fromisoformat(row['updated_at']),
-                requirement_ids=requirement_ids
-            )
+        with self._lock, self._conn as conn:
+            rows = conn.execute(_SQL_GET, (design_id,)).fetchall()
+
+        if not rows:
+            return None
+
+        # One row per linked requirement, design columns repeated
+        id_, name, description, type_, status, created_at, updated_at, _ = rows[0]
+        return Design(
+            id=id_,
+            name=name,
+            description=description,
+            type=type_,
+            status=status,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            requirement_ids=[row[7] for row in rows if row[7] is not None]
+        )
 
     def get_all(self) -> List[Design]:
         """Get all designs"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("SELECT * FROM designs ORDER BY id").fetchall()
-            designs = []
-            for row in rows:
-                req_rows = conn.execute("""
-                    SELECT requirement_id FROM design_requirements WHERE design_id = ?
-                """, (row['id'],)).fetchall()
-                requirement_ids = [r['requirement_id'] for r in req_rows]
-
-                designs.append(Design(
-                    id=row['id'],
-                    name=row['name'],
-                    description=row['description'],
-                    type=row['type'],
-                    status=row['status'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']),
-                    requirement_ids=requirement_ids
-                ))
-            return designs
+        with self._lock, self._conn as conn:
+            rows = conn.execute(_SQL_GET_ALL).fetchall()
+        return self._rows_to_designs(rows)
+
+    def get_by_requirement(self, requirement_id: str) -> List[Design]:
+        """Get all designs linked to a requirement"""
+        with self._lock, self._conn as conn:
+            rows = conn.execute(_SQL_GET_BY_REQUIREMENT, (requirement_id,)).fetchall()
+        return self._rows_to_designs(rows)
+
+    def _rows_to_designs(self, rows: List[tuple]) -> List[Design]:
+        """Build designs from joined (design, linked requirement) rows"""
+        # One row per (design, linked requirement); bucket links per design
+        fromisoformat = datetime.fromisoformat
+        designs = {}
+        for id_, name, description, type_, status, created_at, updated_at, req_id in rows:
+            design = designs.get(id_)
+            if design is None:
+                design = designs[id_] = Design(
+                    id=id_,
+                    name=name,
+                    description=description,
+                    type=type_,
+                    status=status,
+                    created_at=fromisoformat(created_at),
+                    updated_at=fromisoformat(updated_at),
+                    requirement_ids=[]
+                )
+            if req_id is not None:
+                design.requirement_ids.append(req_id)
+        return list(designs.values())
 
     def update(self, design: Design) -> Design:
         """Update an existing design"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE designs SET name = ?, description = ?, type = ?, status = ?, updated_at = ?
-                WHERE id = ?
-            """, (design.name, design.description, design.type, design.status,
+        with self._lock, self._conn as conn:
+            conn.execute(_SQL_UPDATE, (design.name, design.description, design.type, design.status,
                   design.updated_at.isoformat(), design.id))
 
-            # Update requirement links
-            conn.execute("DELETE FROM design_requirements WHERE design_id = ?", (design.id,))
-            if design.requirement_ids:
-                conn.executemany("""
-                    INSERT INTO design_requirements (design_id, requirement_id)
-                    VALUES (?, ?)
-                """, [(design.id, req_id) for req_id in design.requirement_ids])
+            # Update requirement links, writing only the ones that changed
+            current = {row[0] for row in conn.execute(_SQL_GET_LINKS, (design.id,))}
+            wanted = set(design.requirement_ids)
+            removed = current - wanted
+            added = wanted - current
+            if removed:
+                conn.executemany(_SQL_DELETE_LINK, [(design.id, req_id) for req_id in removed])
+            if added:
+                conn.executemany(_SQL_INSERT_LINK, [(design.id, req_id) for req_id in added])
 
             conn.commit()
         return design
 
     def delete(self, design_id: int) -> bool:
         """Delete a design"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM designs WHERE id = ?", (design_id,))
+        with self._lock, self._conn as conn:
+            conn.execute(_SQL_DELETE, (design_id,))
             conn.commit()
         return True
+
+    def delete_many(self, design_ids: List[int]) -> int:
+        """Delete several designs in a single transaction"""
+        with self._lock, self._conn as conn:
+            cursor = conn.executemany(_SQL_DELETE, [(design_id,) for design_id in design_ids])
+            conn.commit()
+        return cursor.rowcount
@@ -1,10 +1,60 @@
 import sqlite3
-from typing import List, Optional, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
-from models.requirement import Requirement
-from models.enums import RequirementStatus, Priority
+from models.requirement import Requirement, RequirementSummary
+from models.enums import STATUS_BY_VALUE, PRIORITY_BY_VALUE
 from exceptions import DatabaseError, EntityNotFoundError
 from repositories.repository_interface import IRepository
+from repositories.sqlite_connection import configure_connection
+
+# SQLite's default limit on bound parameters per statement
+_MAX_VARIABLES = 999
+# Design links written per multi-row INSERT (two parameters each)
+_LINKS_PER_INSERT = 250
+# Columns results may be ordered by
+_ORDER_COLUMNS = frozenset({'id', 'title', 'status', 'priority', 'category',
+                            'created_at', 'updated_at'})
+
+# Statements are kept as constants so the connection's statement cache
+# is hit on every call. Rows are plain tuples in _SQL_SELECT column order
+_SQL_SELECT = '''
+    SELECT id, title, description, status, priority, category,
+           parent_id, verification_criteria, created_at, updated_at
+    FROM requirements
+'''
+_SQL_INSERT = '''
+    INSERT INTO requirements
+    (id, title, description, status, priority, category,
+     parent_id, verification_criteria, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_SELECT_BY_ID = _SQL_SELECT + ' WHERE id = ?'
+_SQL_SELECT_LINKS = 'SELECT design_id FROM requirement_designs WHERE requirement_id = ?'
+_SQL_SELECT_ALL_LINKS = 'SELECT requirement_id, design_id FROM requirement_designs'
+_SQL_SELECT_CHILDREN = _SQL_SELECT + ' WHERE parent_id = ? ORDER BY id'
+_SQL_SELECT_PAGE = _SQL_SELECT + ' WHERE id > ? ORDER BY id LIMIT ?'
+_SQL_UPDATE = '''
+    UPDATE requirements
+    SET title = ?, description = ?, status = ?, priority = ?,
+        category = ?, parent_id = ?, verification_criteria = ?,
+        updated_at = ?
+    WHERE id = ?
+'''
+_SQL_DELETE_LINKS = 'DELETE FROM requirement_designs WHERE requirement_id = ?'
+_SQL_DELETE = 'DELETE FROM requirements WHERE id = ?'
+_SQL_SEARCH = _SQL_SELECT + '''
+    WHERE title LIKE ? ESCAPE '\\'
+       OR description LIKE ? ESCAPE '\\'
+       OR id LIKE ? ESCAPE '\\'
+    ORDER BY id
+'''
+_SQL_NEXT_ID = '''
+    SELECT COALESCE(MAX(CAST(substr(id, 5) AS INTEGER)), 0) + 1
+    FROM requirements
+    WHERE id LIKE 'REQ-%'
+'''
 
 
 class SQLiteRequirementRepository(IRepository[Requirement]):
@@ -18,74 +68,79 @@ class SQLiteRequirementRepository(IRepository[Requirement]):
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._init_database()
 
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
     def _init_database(self):
         """Initialize database schema"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._lock:
+                configure_connection(self._conn)
+                try:
+                    # Create tables and indexes in one script and transaction
+                    self._conn.executescript('''
+                        BEGIN IMMEDIATE;
 
-                # Create requirements table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS requirements (
-                        id VARCHAR(20) PRIMARY KEY,
-                        title VARCHAR(200) NOT NULL,
-                        description TEXT,
-                        status VARCHAR(20) NOT NULL DEFAULT 'Draft',
-                        priority VARCHAR(20) NOT NULL DEFAULT 'Medium',
-                        category VARCHAR(50),
-                        parent_id VARCHAR(20),
-                        verification_criteria TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (parent_id) REFERENCES requirements(id)
-                            ON DELETE SET NULL
-                    )
-                ''')
-
-                # Create requirement-design link table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS requirement_designs (
-                        requirement_id VARCHAR(20) NOT NULL,
-                        design_id INTEGER NOT NULL,
-                        PRIMARY KEY (requirement_id, design_id),
-                        FOREIGN KEY (requirement_id) REFERENCES requirements(id) ON DELETE CASCADE,
-                        FOREIGN KEY (design_id) REFERENCES designs(id) ON DELETE CASCADE
-                    )
-                ''')
-
-                # Create indexes
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_req_status
-                    ON requirements(status)
-                ''')
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_req_parent
-                    ON requirements(parent_id)
-                ''')
-
-                conn.commit()
+                        CREATE TABLE IF NOT EXISTS requirements (
+                            id VARCHAR(20) PRIMARY KEY,
+                            title VARCHAR(200) NOT NULL,
+                            description TEXT,
+                            status VARCHAR(20) NOT NULL DEFAULT 'Draft',
+                            priority VARCHAR(20) NOT NULL DEFAULT 'Medium',
+                            category VARCHAR(50),
+                            parent_id VARCHAR(20),
+                            verification_criteria TEXT,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                            FOREIGN KEY (parent_id) REFERENCES requirements(id)
+                                ON DELETE SET NULL
+                        );
+
+                        CREATE TABLE IF NOT EXISTS requirement_designs (
+                            requirement_id VARCHAR(20) NOT NULL,
+                            design_id INTEGER NOT NULL,
+                            PRIMARY KEY (requirement_id, design_id),
+                            FOREIGN KEY (requirement_id) REFERENCES requirements(id) ON DELETE CASCADE,
+                            FOREIGN KEY (design_id) REFERENCES designs(id) ON DELETE CASCADE
+                        );
+
+                        CREATE INDEX IF NOT EXISTS idx_req_status ON requirements(status);
+                        CREATE INDEX IF NOT EXISTS idx_req_parent ON requirements(parent_id);
+                        CREATE INDEX IF NOT EXISTS idx_req_category ON requirements(category);
+                        CREATE INDEX IF NOT EXISTS idx_reqdesign_design ON requirement_designs(design_id);
+
+                        COMMIT;
+                    ''')
+                except sqlite3.Error:
+                    if self._conn.in_transaction:
+                        self._conn.rollback()
+                    raise
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to initialize database: {str(e)}")
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock for a write, committing on success and rolling back on error"""
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
 
     def create(self, entity: Requirement) -> str:
         """Create new requirement"""
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO requirements
-                    (id, title, description, status, priority, category,
-                     parent_id, verification_criteria, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_SQL_INSERT, (
                     entity.id,
                     entity.title,
                     entity.description,
@@ -99,40 +154,55 @@ class SQLiteRequirementRepository(IRepository[Requirement]):
                 ))
                 
                 # Insert design links
-                if entity.design_ids:
-                    cursor.executemany('''
-                        INSERT INTO requirement_designs (requirement_id, design_id)
-                        VALUES (?, ?)
-                    ''', [(entity.id, design_id) for design_id in entity.design_ids])
-                
-                conn.commit()
+                self._insert_links(cursor, [(entity.id, design_id) for design_id in entity.design_ids])
+
                 return entity.id
         except sqlite3.IntegrityError as e:
             raise DatabaseError(f"Requirement with ID {entity.id} already exists")
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to create requirement: {str(e)}")
 
+    def create_many(self, entities: List[Requirement]) -> List[str]:
+        """Create several requirements in a single transaction"""
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(_SQL_INSERT, ((
+                    entity.id,
+                    entity.title,
+                    entity.description,
+                    entity.status.value,
+                    entity.priority.value,
+                    entity.category,
+                    entity.parent_id,
+                    entity.verification_criteria,
+                    entity.created_at.isoformat(),
+                    entity.updated_at.isoformat()
+                ) for entity in entities))
+
+                # Insert design links
+                self._insert_links(cursor, [(entity.id, design_id)
+                                            for entity in entities for design_id in entity.design_ids])
+
+                return [entity.id for entity in entities]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to create requirements: {str(e)}")
+
     def read(self, entity_id: str) -> Optional[Requirement]:
         """Read requirement by ID"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'SELECT * FROM requirements WHERE id = ?',
-                    (entity_id,)
-                )
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_SELECT_BY_ID, (entity_id,))
                 row = cursor.fetchone()
 
                 if row is None:
                     return None
 
                 # Get linked design IDs
-                cursor.execute(
-                    'SELECT design_id FROM requirement_designs WHERE requirement_id = ?',
-                    (entity_id,)
-                )
+                cursor.execute(_SQL_SELECT_LINKS, (entity_id,))
                 design_rows = cursor.fetchall()
-                design_ids = [r['design_id'] for r in design_rows]
+                design_ids = [design_id for design_id, in design_rows]
 
                 return self._row_to_requirement(row, design_ids)
         except sqlite3.Error as e:
@@ -141,16 +211,9 @@ class SQLiteRequirementRepository(IRepository[Requirement]):
     def update(self, entity: Requirement) -> bool:
         """Update existing requirement"""
         try:
-            entity.updated_at = datetime.now()
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE requirements
-                    SET title = ?, description = ?, status = ?, priority = ?,
-                        category = ?, parent_id = ?, verification_criteria = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                ''', (
+                cursor.execute(_SQL_UPDATE, (
                     entity.title,
                     entity.description,
                     entity.status.value,
@@ -161,124 +224,309 @@ class SQLiteRequirementRepository(IRepository[Requirement]):
                     entity.updated_at.isoformat(),
                     entity.id
                 ))
-                
-                # Update design links
-                cursor.execute('DELETE FROM requirement_designs WHERE requirement_id = ?', (entity.id,))
-                if entity.design_ids:
-                    cursor.executemany('''
-                        INSERT INTO requirement_designs (requirement_id, design_id)
-                        VALUES (?, ?)
-                    ''', [(entity.id, design_id) for design_id in entity.design_ids])
-                
-                conn.commit()
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+
+                # Update design links, writing only the ones that changed
+                cursor.execute(_SQL_SELECT_LINKS, (entity.id,))
+                current = {design_id for design_id, in cursor.fetchall()}
+                removed = list(current.difference(entity.design_ids))
+                for start in range(0, len(removed), _MAX_VARIABLES - 1):
+                    chunk = removed[start:start + _MAX_VARIABLES - 1]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(
+                        'DELETE FROM requirement_designs '
+                        f'WHERE requirement_id = ? AND design_id IN ({placeholders})',
+                        [entity.id, *chunk]
+                    )
+                self._insert_links(cursor, [(entity.id, design_id) for design_id in entity.design_ids
+                                            if design_id not in current])
+
+                return updated
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to update requirement: {str(e)}")
 
+    def update_many(self, entities: List[Requirement]) -> int:
+        """Update several requirements in a single transaction"""
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(_SQL_UPDATE, [(
+                    entity.title,
+                    entity.description,
+                    entity.status.value,
+                    entity.priority.value,
+                    entity.category,
+                    entity.parent_id,
+                    entity.verification_criteria,
+                    entity.updated_at.isoformat(),
+                    entity.id
+                ) for entity in entities])
+                updated = cursor.rowcount
+
+                # Update design links
+                cursor.executemany(_SQL_DELETE_LINKS, [(entity.id,) for entity in entities])
+                self._insert_links(cursor, [(entity.id, design_id)
+                                            for entity in entities for design_id in entity.design_ids])
+
+                return updated
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to update requirements: {str(e)}")
+
+    def _insert_links(self, cursor: sqlite3.Cursor, links: List[tuple]):
+        """Insert (requirement_id, design_id) pairs with multi-row INSERT statements"""
+        for start in range(0, len(links), _LINKS_PER_INSERT):
+            chunk = links[start:start + _LINKS_PER_INSERT]
+            placeholders = ', '.join(['(?, ?)'] * len(chunk))
+            cursor.execute(
+                f'INSERT INTO requirement_designs (requirement_id, design_id) VALUES {placeholders}',
+                [value for link in chunk for value in link]
+            )
+
     def delete(self, entity_id: str) -> bool:
         """Delete requirement by ID"""
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
-                cursor.execute('DELETE FROM requirements WHERE id = ?', (entity_id,))
-                conn.commit()
+                cursor.execute(_SQL_DELETE, (entity_id,))
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to delete requirement: {str(e)}")
 
-    def find_all(self) -> List[Requirement]:
-        """Get all requirements"""
+    def find_all(self, order_by: Optional[str] = 'id', load_links: bool = True) -> List[Requirement]:
+        """
+        Get all requirements
+
+        Args:
+            order_by: Column to sort by, or None to skip sorting
+            load_links: Whether to load linked design IDs; when False,
+                design_ids is left empty and the link table is not read
+
+        Returns:
+            List of all requirements
+        """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT * FROM requirements ORDER BY id')
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_SELECT + self._order_clause(order_by))
                 rows = cursor.fetchall()
-                
-                requirements = []
-                for row in rows:
-                    # Get linked design IDs for each requirement
-                    cursor.execute(
-                        'SELECT design_id FROM requirement_designs WHERE requirement_id = ?',
-                        (row['id'],)
-                    )
-                    design_rows = cursor.fetchall()
-                    design_ids = [r['design_id'] for r in design_rows]
-                    requirements.append(self._row_to_requirement(row, design_ids))
-                
-                return requirements
+                if not load_links:
+                    return [self._row_to_requirement(row) for row in rows]
+                return self._rows_to_requirements(cursor, rows, all_links=True)
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to fetch requirements: {str(e)}")
 
-    def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Requirement]:
-        """Find requirements matching criteria"""
-        try:
-            conditions = []
-            params = []
+    def iter_all(self, load_links: bool = True, batch_size: int = 200) -> Iterator[Requirement]:
+        """
+        Iterate over all requirements in ID order, fetching them in batches
 
-            for key, value in criteria.items():
-                if key in ['status', 'priority', 'category', 'parent_id']:
-                    conditions.append(f"{key} = ?")
-                    params.append(value)
+        Each batch is read under the lock with a query of its own, starting
+        after the last ID of the previous one, so no cursor is left open on
+        the shared connection while the caller consumes requirements.
 
-            query = 'SELECT * FROM requirements'
-            if conditions:
-                query += ' WHERE ' + ' AND '.join(conditions)
-            query += ' ORDER BY id'
+        Args:
+            load_links: Whether to load linked design IDs
+            batch_size: Number of requirements fetched at a time
 
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+        Yields:
+            Requirements one at a time
+        """
+        last_id = ''
+        while True:
+            try:
+                with self._lock:
+                    cursor = self._conn.cursor()
+                    cursor.execute(_SQL_SELECT_PAGE, (last_id, batch_size))
+                    rows = cursor.fetchall()
+                    if load_links:
+                        requirements = self._rows_to_requirements(cursor, rows)
+                    else:
+                        requirements = [self._row_to_requirement(row) for row in rows]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to fetch requirements: {str(e)}")
+
+            yield from requirements
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    def find_by_criteria(self, criteria: Dict[str, Any], order_by: Optional[str] = 'id',
+                         load_links: bool = True) -> List[Requirement]:
+        """
+        Find requirements matching criteria
+
+        Args:
+            criteria: Column values to match
+            order_by: Column to sort by, or None to skip sorting
+            load_links: Whether to load linked design IDs
+
+        Returns:
+            List of matching requirements
+        """
+        try:
+            where, params = self._where_clause(criteria)
+            query = _SQL_SELECT + where + self._order_clause(order_by)
+
+            with self._lock:
+                cursor = self._conn.cursor()
                 cursor.execute(query, params)
                 rows = cursor.fetchall()
-                
-                requirements = []
-                for row in rows:
-                    # Get linked design IDs for each requirement
-                    cursor.execute(
-                        'SELECT design_id FROM requirement_designs WHERE requirement_id = ?',
-                        (row['id'],)
-                    )
-                    design_rows = cursor.fetchall()
-                    design_ids = [r['design_id'] for r in design_rows]
-                    requirements.append(self._row_to_requirement(row, design_ids))
-                
-                return requirements
+                if not load_links:
+                    return [self._row_to_requirement(row) for row in rows]
+                return self._rows_to_requirements(cursor, rows)
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to search requirements: {str(e)}")
 
-    def _row_to_requirement(self, row: sqlite3.Row, design_ids: list = None) -> Requirement:
-        """Convert database row to Requirement object"""
+    def find_summaries(self, criteria: Optional[Dict[str, Any]] = None,
+                       order_by: Optional[str] = 'id') -> List[RequirementSummary]:
+        """
+        Find requirement summaries, skipping the large text columns
+
+        Args:
+            criteria: Column values to match, or None for all requirements
+            order_by: Column to sort by, or None to skip sorting
+
+        Returns:
+            List of matching requirement summaries
+        """
+        try:
+            where, params = self._where_clause(criteria or {})
+            query = ('SELECT id, title, status, priority, category, parent_id FROM requirements'
+                     + where + self._order_clause(order_by))
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+            return [
+                RequirementSummary(
+                    id=id_,
+                    title=title,
+                    status=STATUS_BY_VALUE[status],
+                    priority=PRIORITY_BY_VALUE[priority],
+                    category=category or '',
+                    parent_id=parent_id
+                )
+                for id_, title, status, priority, category, parent_id in rows
+            ]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to fetch requirement summaries: {str(e)}")
+
+    def _where_clause(self, criteria: Dict[str, Any]) -> tuple[str, list]:
+        """Build the WHERE clause and parameters for equality criteria"""
+        conditions = []
+        params = []
+
+        for key, value in criteria.items():
+            if key in ['status', 'priority', 'category', 'parent_id']:
+                conditions.append(f"{key} = ?")
+                params.append(value)
+
+        if not conditions:
+            return '', params
+        return ' WHERE ' + ' AND '.join(conditions), params
+
+    def _order_clause(self, order_by: Optional[str]) -> str:
+        """Build the ORDER BY clause for a whitelisted column"""
+        if order_by is None:
+            return ''
+        if order_by not in _ORDER_COLUMNS:
+            raise ValueError(f"Cannot order requirements by {order_by!r}")
+        return f' ORDER BY {order_by}'
+
+    def get_children_of(self, parent_id: str) -> List[Requirement]:
+        """Get direct children of a requirement using the parent_id index"""
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_SELECT_CHILDREN, (parent_id,))
+                rows = cursor.fetchall()
+                return self._rows_to_requirements(cursor, rows)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to fetch child requirements: {str(e)}")
+
+    def search(self, query: str, load_links: bool = True) -> List[Requirement]:
+        """Find requirements whose ID, title or description contain query"""
+        # Escape LIKE wildcards so the query is matched literally; LIKE is
+        # already case-insensitive, so no per-row lower() is needed
+        escaped = (query
+                   .replace('\\', '\\\\')
+                   .replace('%', '\\%')
+                   .replace('_', '\\_'))
+        pattern = f"%{escaped}%"
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_SEARCH, (pattern, pattern, pattern))
+                rows = cursor.fetchall()
+                if not load_links:
+                    return [self._row_to_requirement(row) for row in rows]
+                return self._rows_to_requirements(cursor, rows)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to search requirements: {str(e)}")
+
+    def _rows_to_requirements(self, cursor: sqlite3.Cursor, rows: List[tuple],
+                              all_links: bool = False) -> List[Requirement]:
+        """
+        Convert requirement rows to objects, loading their design links in bulk
+
+        Args:
+            cursor: Cursor to run the link queries on
+            rows: Requirement rows
+            all_links: Whether rows cover every requirement, in which case
+                the whole link table is read in one scan
+
+        Returns:
+            List of requirements
+        """
+        if all_links:
+            design_map = self._all_design_links(cursor)
+        else:
+            ids = [row[0] for row in rows]
+            design_map: Dict[str, List[int]] = {}
+            for start in range(0, len(ids), _MAX_VARIABLES):
+                chunk = ids[start:start + _MAX_VARIABLES]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    'SELECT requirement_id, design_id FROM requirement_designs '
+                    f'WHERE requirement_id IN ({placeholders})',
+                    chunk
+                )
+                for requirement_id, design_id in cursor:
+                    design_map.setdefault(requirement_id, []).append(design_id)
+
+        return [self._row_to_requirement(row, design_map.get(row[0])) for row in rows]
+
+    def _all_design_links(self, cursor: sqlite3.Cursor) -> Dict[str, List[int]]:
+        """Read the whole link table into a requirement ID to design IDs map"""
+        design_map: Dict[str, List[int]] = {}
+        cursor.execute(_SQL_SELECT_ALL_LINKS)
+        for requirement_id, design_id in cursor:
+            design_map.setdefault(requirement_id, []).append(design_id)
+        return design_map
+
+    def _row_to_requirement(self, row: tuple, design_ids: list = None) -> Requirement:
+        """Convert a database row in _SQL_SELECT column order to a Requirement"""
+        (id_, title, description, status, priority, category,
+         parent_id, verification_criteria, created_at, updated_at) = row
         return Requirement(
-            id=row['id'],
-            title=row['title'],
-            description=row['description'] or '',
-            status=RequirementStatus(row['status']),
-            priority=Priority(row['priority']),
-            category=row['category'] or '',
-            parent_id=row['parent_id'],
-            verification_criteria=row['verification_criteria'] or '',
+            id=id_,
+            title=title,
+            description=description or '',
+            status=STATUS_BY_VALUE[status],
+            priority=PRIORITY_BY_VALUE[priority],
+            category=category or '',
+            parent_id=parent_id,
+            verification_criteria=verification_criteria or '',
             design_ids=design_ids or [],
-            created_at=datetime.fromisoformat(row['created_at']),
-            updated_at=datetime.fromisoformat(row['updated_at'])
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at)
         )
 
     def get_next_id(self) -> str:
         """Generate next requirement ID"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id FROM requirements
-                    WHERE id LIKE 'REQ-%'
-                    ORDER BY id DESC
-                    LIMIT 1
-                ''')
-                row = cursor.fetchone()
-
-                if row is None:
-                    return "REQ-001"
-
-                last_id = row['id']
-                number = int(last_id.split('-')[1]) + 1
+            with self._lock:
+                cursor = self._conn.cursor()
+                # Compare numerically so REQ-1000 sorts after REQ-999
+                cursor.execute(_SQL_NEXT_ID)
+                number = cursor.fetchone()[0]
                 return f"REQ-{number:03d}"
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to generate ID: {str(e)}")
@@ -1,8 +1,24 @@
 from dataclasses import dataclass
 from typing import List, Optional
 from models.requirement import Requirement
+from models.enums import RequirementStatus, Priority
 from exceptions import ValidationError
 
+_STATUSES = frozenset(RequirementStatus)
+_PRIORITIES = frozenset(Priority)
+
+# (predicate, message) pairs checked in order; a message is formatted with
+# the requirement, and predicates guard themselves against missing fields
+_RULES = (
+    (lambda r: r.id and r.id.startswith("REQ-"), "ID must start with 'REQ-'"),
+    (lambda r: not r.id or len(r.id) <= 20, "ID must not exceed 20 characters"),
+    (lambda r: r.title and r.title.strip(), "Title is required"),
+    (lambda r: not r.title or len(r.title) <= 200, "Title must not exceed 200 characters"),
+    (lambda r: not r.category or len(r.category) <= 50, "Category must not exceed 50 characters"),
+    (lambda r: r.status in _STATUSES, "Invalid status: {0.status}"),
+    (lambda r: r.priority in _PRIORITIES, "Invalid priority: {0.priority}"),
+)
+
 
 @dataclass
 class ValidationResult:
@@ -27,40 +43,7 @@ class ValidationService:
         Returns:
             ValidationResult with validation status and errors
         """
-        errors = []
-
-        # Validate ID format
-        if not req.id or not req.id.startswith("REQ-"):
-            errors.append("ID must start with 'REQ-'")
-
-        if req.id and len(req.id) > 20:
-            errors.append("ID must not exceed 20 characters")
-
-        # Validate title
-        if not req.title or len(req.title.strip()) == 0:
-            errors.append("Title is required")
-
-        if req.title and len(req.title) > 200:
-            errors.append("Title must not exceed 200 characters")
-
-        # Validate category
-        if req.category and len(req.category) > 50:
-            errors.append("Category must not exceed 50 characters")
-
-        # Validate status
-        try:
-            if req.status not in [status for status in req.status.__class__]:
-                errors.append(f"Invalid status: {req.status}")
-        except:
-            errors.append("Invalid status value")
-
-        # Validate priority
-        try:
-            if req.priority not in [priority for priority in req.priority.__class__]:
-                errors.append(f"Invalid priority: {req.priority}")
-        except:
-            errors.append("Invalid priority value")
-
+        errors = [message.format(req) for is_valid, message in _RULES if not is_valid(req)]
         return ValidationResult(
             valid=len(errors) == 0,
             errors=errors
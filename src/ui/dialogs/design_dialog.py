@@ -74,6 +74,8 @@ class DesignDialog(QDialog):
         )
         editor_widget.addTab(self.description_edit, "Edit")
 
+        self.description_edit.textChanged.connect(self._update_preview)
+
         splitter.addWidget(editor_widget)
 
         # Preview side
@@ -83,10 +85,11 @@ class DesignDialog(QDialog):
         
         # Refresh button
         refresh_button = QPushButton("Refresh Preview")
-        refresh_button.clicked.connect(self._update_preview)
+        refresh_button.clicked.connect(self._refresh_preview)
         preview_layout.addWidget(refresh_button)
         
-        self.markdown_preview = MarkdownViewer()
+        # Re-render the preview once typing pauses rather than per keystroke
+        self.markdown_preview = MarkdownViewer(render_delay=300)
         preview_layout.addWidget(self.markdown_preview)
         
         preview_widget = QTabWidget()
@@ -105,12 +108,14 @@ class DesignDialog(QDialog):
         self.requirements_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.requirements_list.setMaximumHeight(120)
 
-        # Populate requirements
-        for req in self.requirements:
-            item_text = f"REQ-{req.id}: {req.title}"
-            self.requirements_list.addItem(item_text)
-            item = self.requirements_list.item(self.requirements_list.count() - 1)
-            item.setData(Qt.ItemDataRole.UserRole, req.id)
+        # Populate requirements in one batch, then attach their IDs
+        self.requirements_list.setUpdatesEnabled(False)
+        self.requirements_list.blockSignals(True)
+        self.requirements_list.addItems([f"{req.id}: {req.title}" for req in self.requirements])
+        for row, req in enumerate(self.requirements):
+            self.requirements_list.item(row).setData(Qt.ItemDataRole.UserRole, req.id)
+        self.requirements_list.blockSignals(False)
+        self.requirements_list.setUpdatesEnabled(True)
 
         layout.addWidget(self.requirements_list)
 
@@ -134,11 +139,16 @@ class DesignDialog(QDialog):
         markdown_text = self.description_edit.toPlainText()
         self.markdown_preview.set_markdown(markdown_text)
 
+    def _refresh_preview(self):
+        """Render the markdown preview immediately"""
+        self._update_preview()
+        self.markdown_preview.flush()
+
     def load_design_data(self):
         """Load existing design data into the form"""
         self.name_edit.setText(self.design.name)
         self.description_edit.setText(self.design.description)
-        self._update_preview()
+        self._refresh_preview()
 
         # Set type
         type_index = self.type_combo.findText(self.design.type)
@@ -151,10 +161,10 @@ class DesignDialog(QDialog):
             self.status_combo.setCurrentIndex(status_index)
 
         # Select linked requirements
+        linked_ids = set(self.design.requirement_ids)
         for i in range(self.requirements_list.count()):
             item = self.requirements_list.item(i)
-            req_id = item.data(Qt.ItemDataRole.UserRole)
-            if req_id in self.design.requirement_ids:
+            if item.data(Qt.ItemDataRole.UserRole) in linked_ids:
                 item.setSelected(True)
 
     def get_data(self) -> dict:
@@ -1,16 +1,18 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QListWidgetItem, QLabel, QLineEdit
+    QListView, QLabel, QLineEdit, QAbstractItemView
 )
-from PyQt6.QtCore import Qt
-from typing import List, Set
+from PyQt6.QtCore import Qt, QItemSelection, QItemSelectionModel, QTimer
+from typing import Dict, List, Optional, Set
 from models.design import Design
+from ui.models.design_list_model import DesignListModel, DesignFilterProxyModel
 
 
 class DesignSelectorDialog(QDialog):
     """Dialog for selecting designs to link"""
 
-    def __init__(self, parent=None, designs: List[Design] = None, selected_design_ids: Set[int] = None):
+    def __init__(self, parent=None, designs: List[Design] = None, selected_design_ids: Set[int] = None,
+                 design_index: Optional[Dict[int, Design]] = None):
         """
         Initialize dialog
 
@@ -18,17 +20,25 @@ class DesignSelectorDialog(QDialog):
             parent: Parent widget
             designs: List of available designs
             selected_design_ids: Set of currently selected design IDs
+            design_index: Designs by ID, if the caller already built the index
         """
         super().__init__(parent)
         self.designs = designs or []
+        if design_index is None:
+            design_index = {d.id: d for d in self.designs}
+        self._design_by_id = design_index
         self.selected_design_ids = selected_design_ids or set()
+        # Selected IDs, kept apart from the view so filtered-out rows stay selected
+        self._selected_ids = set(self.selected_design_ids)
+        self._syncing_selection = False
         
         self.setWindowTitle("Select Designs")
         self.setMinimumWidth(600)
         self.setMinimumHeight(500)
         
         self._init_ui()
-        self._populate_list()
+        # Populate once the event loop runs so the dialog shows without waiting
+        QTimer.singleShot(0, self._populate_list)
 
     def _init_ui(self):
         """Initialize UI components"""
@@ -49,8 +59,15 @@ class DesignSelectorDialog(QDialog):
         layout.addLayout(search_layout)
         
         # Design list
-        self.design_list = QListWidget()
-        self.design_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        self.design_model = DesignListModel(parent=self)
+        self.proxy_model = DesignFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.design_model)
+        self.design_list = QListView()
+        self.design_list.setModel(self.proxy_model)
+        self.design_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        self.design_list.setUniformItemSizes(True)
+        self.design_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.design_list.setBatchSize(256)
         layout.addWidget(self.design_list)
         
         # Selection info
@@ -83,46 +100,70 @@ class DesignSelectorDialog(QDialog):
         layout.addLayout(button_layout)
         
         # Connect selection change
-        self.design_list.itemSelectionChanged.connect(self._update_selection_label)
+        self.design_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
     def _populate_list(self):
         """Populate the design list"""
-        self.design_list.clear()
-        
-        for design in self.designs:
-            item_text = f"{design.name} [{design.type}] - {design.status}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, design.id)
-            
-            # Select if previously selected
-            if design.id in self.selected_design_ids:
-                item.setSelected(True)
-            
-            self.design_list.addItem(item)
+        self._syncing_selection = True
+        self.design_model.set_designs(self.designs)
+        self._apply_selection()
 
     def _filter_designs(self, text: str):
         """Filter designs based on search text"""
-        text_lower = text.lower()
-        
-        for i in range(self.design_list.count()):
-            item = self.design_list.item(i)
-            item_text = item.text().lower()
-            item.setHidden(text_lower not in item_text)
+        # Rows leaving the filter drop out of the view's selection; the
+        # selected ID set must not follow
+        self._syncing_selection = True
+        if self.proxy_model.set_query(text):
+            self._apply_selection()
+        else:
+            self._syncing_selection = False
+
+    def _apply_selection(self):
+        """Select the visible rows whose designs are in the selected ID set"""
+        # One range per run of consecutive selected rows, not one per row
+        selection = QItemSelection()
+        start = None
+        row_count = self.proxy_model.rowCount()
+        for row in range(row_count + 1):
+            selected = (row < row_count and
+                        self.proxy_model.index(row, 0).data(Qt.ItemDataRole.UserRole) in self._selected_ids)
+            if selected and start is None:
+                start = row
+            elif not selected and start is not None:
+                selection.select(self.proxy_model.index(start, 0), self.proxy_model.index(row - 1, 0))
+                start = None
+
+        self._syncing_selection = True
+        self.design_list.selectionModel().select(
+            selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+        self._syncing_selection = False
+        self._update_selection_label()
+
+    def _on_selection_changed(self, selected: QItemSelection, deselected: QItemSelection):
+        """Track user selection changes in the selected ID set"""
+        if self._syncing_selection:
+            return
+        for index in selected.indexes():
+            self._selected_ids.add(index.data(Qt.ItemDataRole.UserRole))
+        for index in deselected.indexes():
+            self._selected_ids.discard(index.data(Qt.ItemDataRole.UserRole))
+        self._update_selection_label()
 
     def _select_all(self):
         """Select all visible items"""
-        for i in range(self.design_list.count()):
-            item = self.design_list.item(i)
-            if not item.isHidden():
-                item.setSelected(True)
+        # selectAll() applies one range covering every visible row, so the
+        # selected ID set and label are updated from a single signal
+        self.design_list.selectAll()
 
     def _clear_all(self):
         """Clear all selections"""
-        self.design_list.clearSelection()
+        self._selected_ids.clear()
+        self._apply_selection()
 
     def _update_selection_label(self):
         """Update the selection count label"""
-        count = len(self.design_list.selectedItems())
+        count = len(self._selected_ids)
         self.selection_label.setText(f"Selected: {count} design(s)")
 
     def get_selected_design_ids(self) -> Set[int]:
@@ -132,12 +173,7 @@ class DesignSelectorDialog(QDialog):
         Returns:
             Set of selected design IDs
         """
-        selected_ids = set()
-        for item in self.design_list.selectedItems():
-            design_id = item.data(Qt.ItemDataRole.UserRole)
-            if design_id is not None:
-                selected_ids.add(design_id)
-        return selected_ids
+        return set(self._selected_ids)
 
     def get_selected_designs(self) -> List[Design]:
         """
@@ -146,5 +182,6 @@ class DesignSelectorDialog(QDialog):
         Returns:
             List of selected designs
         """
-        selected_ids = self.get_selected_design_ids()
-        return [d for d in self.designs if d.id in selected_ids]
+        return [self._design_by_id[design_id]
+                for design_id in sorted(self._selected_ids)
+                if design_id in self._design_by_id]
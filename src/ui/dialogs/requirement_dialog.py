@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QLabel, QMessageBox, QListWidget, QListWidgetItem
 )
 from PyQt6.QtCore import Qt
+from bisect import bisect_left
 from typing import Optional, Dict, Any, List, Set
 from models.requirement import Requirement
 from models.design import Design
@@ -14,6 +15,9 @@ from ui.dialogs.design_selector_dialog import DesignSelectorDialog
 class RequirementDialog(QDialog):
     """Dialog for creating/editing requirements"""
 
+    STATUSES = tuple(status.value for status in RequirementStatus)
+    PRIORITIES = tuple(priority.value for priority in Priority)
+
     def __init__(self, parent=None, requirement: Optional[Requirement] = None, 
                  available_designs: Optional[List[Design]] = None):
         """
@@ -28,7 +32,11 @@ class RequirementDialog(QDialog):
         self.requirement = requirement
         self.is_edit_mode = requirement is not None
         self.available_designs = available_designs or []
+        self._design_by_id = {d.id: d for d in self.available_designs}
         self.selected_design_ids: Set[int] = set()
+        # Design IDs shown in the linked designs list, sorted like its rows
+        self._displayed_ids: List[int] = []
+        self._placeholder_shown = False
 
         self.setWindowTitle("Edit Requirement" if self.is_edit_mode else "Create Requirement")
         self.setMinimumWidth(600)
@@ -63,12 +71,12 @@ class RequirementDialog(QDialog):
 
         # Status field
         self.status_combo = QComboBox()
-        self.status_combo.addItems([status.value for status in RequirementStatus])
+        self.status_combo.addItems(self.STATUSES)
         form_layout.addRow("Status:", self.status_combo)
 
         # Priority field
         self.priority_combo = QComboBox()
-        self.priority_combo.addItems([priority.value for priority in Priority])
+        self.priority_combo.addItems(self.PRIORITIES)
         self.priority_combo.setCurrentText(Priority.MEDIUM.value)
         form_layout.addRow("Priority:", self.priority_combo)
 
@@ -83,6 +91,7 @@ class RequirementDialog(QDialog):
         self.design_trace_display = QListWidget()
         self.design_trace_display.setMaximumHeight(80)
         self.design_trace_display.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self.design_trace_display.setUniformItemSizes(True)
         
         design_trace_button_layout = QVBoxLayout()
         self.design_selector_button = QPushButton("→")
@@ -134,14 +143,23 @@ class RequirementDialog(QDialog):
     def _populate_fields(self):
         """Populate fields with existing requirement data"""
         if self.requirement:
-            self.id_input.setText(self.requirement.id)
-            self.title_input.setText(self.requirement.title)
-            self.status_combo.setCurrentText(self.requirement.status.value)
-            self.priority_combo.setCurrentText(self.requirement.priority.value)
-            self.category_input.setText(self.requirement.category)
-            self.description_input.setPlainText(self.requirement.description)
-            self.verification_input.setPlainText(self.requirement.verification_criteria)
-            
+            # Fill the form without a change signal per field
+            fields = (self.id_input, self.title_input, self.status_combo, self.priority_combo,
+                      self.category_input, self.description_input, self.verification_input)
+            for field in fields:
+                field.blockSignals(True)
+            try:
+                self.id_input.setText(self.requirement.id)
+                self.title_input.setText(self.requirement.title)
+                self.status_combo.setCurrentText(self.requirement.status.value)
+                self.priority_combo.setCurrentText(self.requirement.priority.value)
+                self.category_input.setText(self.requirement.category)
+                self.description_input.setPlainText(self.requirement.description)
+                self.verification_input.setPlainText(self.requirement.verification_criteria)
+            finally:
+                for field in fields:
+                    field.blockSignals(False)
+
             # Load linked designs if the requirement has design_ids
             if hasattr(self.requirement, 'design_ids') and self.requirement.design_ids:
                 self.selected_design_ids = set(self.requirement.design_ids)
@@ -151,8 +169,9 @@ class RequirementDialog(QDialog):
         """Open design selector dialog"""
         dialog = DesignSelectorDialog(
             self, 
-            self.available_designs, 
-            self.selected_design_ids
+            self.available_designs,
+            self.selected_design_ids,
+            design_index=self._design_by_id
         )
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -161,20 +180,31 @@ class RequirementDialog(QDialog):
 
     def _update_design_display(self):
         """Update the design display list"""
-        self.design_trace_display.clear()
-        
-        # Find and display selected designs
-        selected_designs = [d for d in self.available_designs if d.id in self.selected_design_ids]
-        
-        for design in selected_designs:
-            item_text = f"{design.name} [{design.type}]"
-            item = QListWidgetItem(item_text)
-            self.design_trace_display.addItem(item)
-        
-        if not selected_designs:
+        display = self.design_trace_display
+        wanted = {design_id for design_id in self.selected_design_ids if design_id in self._design_by_id}
+        shown = set(self._displayed_ids)
+
+        # Only add and remove the rows that changed, keeping rows in ID order
+        if wanted and self._placeholder_shown:
+            display.takeItem(0)
+            self._placeholder_shown = False
+
+        for design_id in shown - wanted:
+            row = bisect_left(self._displayed_ids, design_id)
+            display.takeItem(row)
+            del self._displayed_ids[row]
+
+        for design_id in sorted(wanted - shown):
+            design = self._design_by_id[design_id]
+            row = bisect_left(self._displayed_ids, design_id)
+            display.insertItem(row, QListWidgetItem(f"{design.name} [{design.type}]"))
+            self._displayed_ids.insert(row, design_id)
+
+        if not wanted and not self._placeholder_shown:
             item = QListWidgetItem("(No designs linked)")
             item.setForeground(Qt.GlobalColor.gray)
-            self.design_trace_display.addItem(item)
+            display.addItem(item)
+            self._placeholder_shown = True
 
     def _on_save(self):
         """Handle save button click"""
@@ -204,7 +234,7 @@ class RequirementDialog(QDialog):
             'priority': self.priority_combo.currentText(),
             'category': self.category_input.text().strip(),
             'verification_criteria': self.verification_input.toPlainText().strip(),
-            'design_ids': list(self.selected_design_ids)
+            'design_ids': sorted(self.selected_design_ids)
         }
 
         if self.id_input.text().strip():
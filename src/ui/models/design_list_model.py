@@ -0,0 +1,89 @@
+from typing import List, Optional
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+from models.design import Design
+
+
+class DesignListModel(QAbstractListModel):
+    """List model over designs, formatting rows only when they are shown"""
+
+    def __init__(self, designs: Optional[List[Design]] = None, parent=None):
+        super().__init__(parent)
+        self._designs: List[Design] = []
+        self._haystacks: List[str] = []
+        self._set_rows(designs or [])
+
+    def set_designs(self, designs: List[Design]):
+        """Replace the listed designs"""
+        self.beginResetModel()
+        self._set_rows(designs)
+        self.endResetModel()
+
+    def _set_rows(self, designs: List[Design]):
+        """Store designs with their lowercased name/type search text"""
+        self._designs = list(designs)
+        self._haystacks = [f"{d.name}\x1f{d.type}".lower() for d in self._designs]
+
+    def design(self, row: int) -> Design:
+        """Get the design at a row"""
+        return self._designs[row]
+
+    def haystack(self, row: int) -> str:
+        """Get the lowercased text a row is searched by"""
+        return self._haystacks[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._designs)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        design = self._designs[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{design.name} [{design.type}] - {design.status}"
+        if role == Qt.ItemDataRole.UserRole:
+            return design.id
+        return None
+
+
+class DesignFilterProxyModel(QSortFilterProxyModel):
+    """Filters a DesignListModel by case-insensitive name or type terms"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._terms: List[str] = []
+        self._matches: List[bool] = []
+        self._narrowing = False
+
+    def setSourceModel(self, model: DesignListModel):
+        # Connected ahead of the base class's own reset handling so stale
+        # matches are dropped before the new rows are filtered
+        model.modelReset.connect(self._forget_matches)
+        super().setSourceModel(model)
+        self._forget_matches()
+
+    def _forget_matches(self):
+        """Discard per-row results after the source rows change"""
+        self._matches = [True] * self.sourceModel().rowCount()
+        self._narrowing = False
+
+    def set_query(self, text: str) -> bool:
+        """Show only designs whose name or type contains every word of text, returning whether rows were refiltered"""
+        terms = text.lower().split()
+        # Changes in case or spacing alone leave the visible rows as they are
+        if terms == self._terms:
+            return False
+        # When each previous term is part of a new one, rows that failed the
+        # previous query fail this one too and are rejected without a search
+        self._narrowing = all(any(old in new for new in terms) for old in self._terms)
+        self._terms = terms
+        self.invalidateRowsFilter()
+        return True
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._narrowing and not self._matches[source_row]:
+            return False
+        haystack = self.sourceModel().haystack(source_row)
+        accepted = all(term in haystack for term in self._terms)
+        self._matches[source_row] = accepted
+        return accepted
@@ -0,0 +1,90 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from models.design import Design
+
+
+@lru_cache(maxsize=4096)
+def _format_updated(timestamp: datetime) -> str:
+    """Format an update time for the table, reusing results across reloads"""
+    return timestamp.strftime("%Y-%m-%d %H:%M")
+
+
+class DesignTableModel(QAbstractTableModel):
+    """Table model over designs, formatting cells only when they are shown"""
+
+    HEADERS = ("ID", "Name", "Type", "Status", "Requirements", "Updated")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._designs: List[Design] = []
+        self._rows: Dict[int, int] = {}
+
+    def set_designs(self, designs: List[Design]):
+        """Replace the listed designs"""
+        self.beginResetModel()
+        self._designs = list(designs)
+        self._rows = {design.id: row for row, design in enumerate(self._designs)}
+        self.endResetModel()
+
+    def add_design(self, design: Design):
+        """Append a design as a new row"""
+        row = len(self._designs)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._designs.append(design)
+        self._rows[design.id] = row
+        self.endInsertRows()
+
+    def refresh_design(self, design: Design):
+        """Repaint the row of a design that was changed in place"""
+        row = self.row_of(design.id)
+        if row < 0:
+            return
+        self._designs[row] = design
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def design(self, row: int) -> Optional[Design]:
+        """Get the design at a row"""
+        if 0 <= row < len(self._designs):
+            return self._designs[row]
+        return None
+
+    def row_of(self, design_id: int) -> int:
+        """Get the row of a design, or -1 if it is not listed"""
+        return self._rows.get(design_id, -1)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._designs)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        design = self._designs[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return design
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        column = index.column()
+        if column == 0:
+            return str(design.id)
+        if column == 1:
+            return design.name
+        if column == 2:
+            return design.type
+        if column == 3:
+            return design.status
+        if column == 4:
+            return str(len(design.requirement_ids))
+        return _format_updated(design.updated_at)
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
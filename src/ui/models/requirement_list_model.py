@@ -0,0 +1,115 @@
+from collections import OrderedDict
+from typing import List, Optional
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from controllers.requirement_controller import RequirementController
+from models.requirement import Requirement
+
+
+class RequirementListModel(QAbstractListModel):
+    """List model over requirement IDs that hydrates rows on demand"""
+
+    CACHE_SIZE = 1000
+
+    def __init__(self, controller: RequirementController, parent=None):
+        """
+        Initialize model
+
+        Args:
+            controller: Requirement controller used to load uncached rows
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.controller = controller
+        self._ids: List[str] = []
+        self._rows: dict[str, int] = {}
+        self._cache: OrderedDict[str, Requirement] = OrderedDict()
+
+    def set_requirements(self, requirements: List[Requirement]):
+        """Replace the listed requirements, seeding the cache with them"""
+        new_ids = [req.id for req in requirements]
+        diffed = self._apply_row_diff(new_ids)
+        if not diffed:
+            self.beginResetModel()
+            self._ids = new_ids
+        self._rows = {req_id: row for row, req_id in enumerate(self._ids)}
+        self._cache.clear()
+        # The first rows are the ones visible before any scrolling
+        for req in requirements[:self.CACHE_SIZE]:
+            self._cache[req.id] = req
+        if not diffed:
+            self.endResetModel()
+        elif self._ids:
+            # Rows that stayed may show an edited title
+            self.dataChanged.emit(self.index(0), self.index(len(self._ids) - 1))
+
+    def _apply_row_diff(self, new_ids: List[str]) -> bool:
+        """
+        Turn the listed IDs into new_ids by removing and inserting rows
+
+        Kept rows, and so the view's selection, stay in place. Returns False
+        without changing anything if kept IDs were reordered.
+        """
+        new_set = set(new_ids)
+        old_set = set(self._ids)
+        if [i for i in self._ids if i in new_set] != [i for i in new_ids if i in old_set]:
+            return False
+
+        # Remove runs of dropped rows from the bottom up
+        row = len(self._ids) - 1
+        while row >= 0:
+            if self._ids[row] in new_set:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and self._ids[row] not in new_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, end)
+            del self._ids[row + 1:end + 1]
+            self.endRemoveRows()
+
+        # Insert runs of new rows top down; kept rows already line up
+        row = 0
+        while row < len(new_ids):
+            if row < len(self._ids) and self._ids[row] == new_ids[row]:
+                row += 1
+                continue
+            start = row
+            while row < len(new_ids) and new_ids[row] not in old_set:
+                row += 1
+            self.beginInsertRows(QModelIndex(), start, row - 1)
+            self._ids[start:start] = new_ids[start:row]
+            self.endInsertRows()
+        return True
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        req_id = self._ids[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return req_id
+        if role == Qt.ItemDataRole.DisplayRole:
+            req = self.requirement(req_id)
+            return f"{req.id}: {req.title}" if req else req_id
+        return None
+
+    def requirement(self, req_id: str) -> Optional[Requirement]:
+        """Get a listed requirement, loading it if it is not cached"""
+        req = self._cache.get(req_id)
+        if req is not None:
+            self._cache.move_to_end(req_id)
+            return req
+
+        req = self.controller.manager.get_requirement(req_id)
+        if req is not None:
+            self._cache[req_id] = req
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return req
+
+    def row_of(self, req_id: str) -> int:
+        """Get the row of a requirement, or -1 if it is not listed"""
+        return self._rows.get(req_id, -1)
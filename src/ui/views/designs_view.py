@@ -1,11 +1,13 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+    QTableView, QAbstractItemView, QHeaderView, QMessageBox,
     QSplitter, QGroupBox
 )
 from PyQt6.QtCore import Qt
+from typing import List, Optional
 from controllers.design_controller import DesignController
 from ui.dialogs.design_dialog import DesignDialog
+from ui.models.design_table_model import DesignTableModel
 from ui.widgets.markdown_viewer import MarkdownViewer
 
 
@@ -16,6 +18,8 @@ class DesignsView(QWidget):
         super().__init__()
         self.controller = controller
         self.requirement_controller = requirement_controller
+        self._requirement_summaries: Optional[List] = None
+        self.requirement_controller.data_changed.connect(self._invalidate_requirements)
         self.init_ui()
         self.load_designs()
 
@@ -57,11 +61,9 @@ class DesignsView(QWidget):
         table_layout.addLayout(toolbar)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Name", "Type", "Status", "Requirements", "Updated"
-        ])
+        self.table_model = DesignTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
 
         # Configure column resize modes for responsiveness
         header = self.table.horizontalHeader()
@@ -85,15 +87,15 @@ class DesignsView(QWidget):
         )  # Updated
 
         self.table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QAbstractItemView.SelectionBehavior.SelectRows
         )
         self.table.setSelectionMode(
-            QTableWidget.SelectionMode.SingleSelection
+            QAbstractItemView.SelectionMode.SingleSelection
         )
         self.table.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
+            QAbstractItemView.EditTrigger.NoEditTriggers
         )
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.table.doubleClicked.connect(self.edit_design)
         table_layout.addWidget(self.table)
 
@@ -104,7 +106,8 @@ class DesignsView(QWidget):
         preview_layout = QVBoxLayout(preview_group)
         preview_layout.setContentsMargins(5, 5, 5, 5)
 
-        self.preview = MarkdownViewer()
+        # Render the preview once selection settles, not on every row passed
+        self.preview = MarkdownViewer(render_delay=100)
         preview_layout.addWidget(self.preview)
 
         splitter.addWidget(preview_group)
@@ -120,38 +123,14 @@ class DesignsView(QWidget):
 
     def load_designs(self):
         """Load designs into the table"""
-        designs = self.controller.get_all_designs()
-        self.table.setRowCount(len(designs))
+        self.table_model.set_designs(self.controller.get_all_designs())
 
-        for row, design in enumerate(designs):
-            # ID
-            id_item = QTableWidgetItem(str(design.id))
-            id_item.setData(Qt.ItemDataRole.UserRole, design)
-            self.table.setItem(row, 0, id_item)
-
-            # Name
-            self.table.setItem(row, 1, QTableWidgetItem(design.name))
-
-            # Type
-            self.table.setItem(row, 2, QTableWidgetItem(design.type))
-
-            # Status
-            self.table.setItem(row, 3, QTableWidgetItem(design.status))
-
-            # Requirements count
-            req_count = len(design.requirement_ids)
-            self.table.setItem(row, 4, QTableWidgetItem(str(req_count)))
-
-            # Updated date
-            updated = design.updated_at.strftime("%Y-%m-%d %H:%M")
-            self.table.setItem(row, 5, QTableWidgetItem(updated))
-
-        # Update preview for selected item
-        self.update_preview()
+        # A model reset clears the selection without emitting selectionChanged
+        self.on_selection_changed()
 
     def on_selection_changed(self):
         """Handle selection change"""
-        has_selection = len(self.table.selectedItems()) > 0
+        has_selection = self.table.selectionModel().hasSelection()
         self.edit_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
         self.update_preview()
@@ -166,35 +145,38 @@ class DesignsView(QWidget):
 
     def get_selected_design(self):
         """Get the currently selected design"""
-        selection_model = self.table.selectionModel()
-        if not selection_model:
-            return None
-        selected_rows = selection_model.selectedRows()
+        selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
             return None
-        row = selected_rows[0].row()
-        item = self.table.item(row, 0)
-        if not item:
-            return None
-        return item.data(Qt.ItemDataRole.UserRole)
+        return self.table_model.design(selected_rows[0].row())
+
+    def _invalidate_requirements(self):
+        """Drop cached requirement summaries after requirements change"""
+        self._requirement_summaries = None
+
+    def _get_requirements(self) -> List:
+        """Get requirement summaries for the design dialog, cached until changed"""
+        if self._requirement_summaries is None:
+            self._requirement_summaries = self.requirement_controller.get_requirement_summaries()
+        return self._requirement_summaries
 
     def add_design(self):
         """Add a new design"""
         # Get available requirements
-        requirements = self.requirement_controller.get_all_requirements()
+        requirements = self._get_requirements()
 
         dialog = DesignDialog(self, requirements=requirements)
         if dialog.exec():
             data = dialog.get_data()
             try:
-                self.controller.create_design(
+                design = self.controller.create_design(
                     name=data['name'],
                     description=data['description'],
                     type=data['type'],
                     status=data['status'],
                     requirement_ids=data.get('requirement_ids', [])
                 )
-                self.load_designs()
+                self.table_model.add_design(design)
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -209,7 +191,7 @@ class DesignsView(QWidget):
             return
 
         # Get available requirements
-        requirements = self.requirement_controller.get_all_requirements()
+        requirements = self._get_requirements()
 
         dialog = DesignDialog(self, design=design, requirements=requirements)
         if dialog.exec():
@@ -221,7 +203,8 @@ class DesignsView(QWidget):
                 design.status = data['status']
                 design.requirement_ids = data.get('requirement_ids', [])
                 self.controller.update_design(design)
-                self.load_designs()
+                self.table_model.refresh_design(design)
+                self.update_preview()
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -234,22 +217,32 @@ class DesignsView(QWidget):
         design = self.get_selected_design()
         if not design:
             return
+        self.delete_designs([design])
+
+    def delete_designs(self, designs: List):
+        """Delete several designs after a single confirmation"""
+        if not designs:
+            return
 
+        if len(designs) == 1:
+            question = f"Are you sure you want to delete design '{designs[0].name}'?"
+        else:
+            question = f"Are you sure you want to delete {len(designs)} designs?"
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
-            f"Are you sure you want to delete design '{design.name}'?",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.controller.delete_design(design.id)
+                self.controller.delete_designs([design.id for design in designs])
                 self.load_designs()
             except Exception as e:
                 QMessageBox.critical(
                     self,
                     "Error",
-                    f"Failed to delete design: {str(e)}"
+                    f"Failed to delete designs: {str(e)}"
                 )
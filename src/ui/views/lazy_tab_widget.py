@@ -0,0 +1,34 @@
+from typing import Callable, Dict, Optional
+from PyQt6.QtWidgets import QTabWidget, QWidget, QVBoxLayout
+
+
+class LazyTabWidget(QTabWidget):
+    """Tab widget that builds each tab's content the first time it is shown"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._factories: Dict[QWidget, Callable[[], QWidget]] = {}
+        self._views: Dict[QWidget, QWidget] = {}
+        self.currentChanged.connect(self._ensure_built)
+
+    def add_lazy_tab(self, factory: Callable[[], QWidget], title: str) -> int:
+        """Add a tab whose content is created by factory on first display"""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._factories[placeholder] = factory
+        return self.addTab(placeholder, title)
+
+    def view(self, index: int) -> Optional[QWidget]:
+        """Get the content of a tab, or None if it has not been built yet"""
+        return self._views.get(self.widget(index))
+
+    def _ensure_built(self, index: int):
+        """Build the content of the tab at index if still pending"""
+        placeholder = self.widget(index)
+        factory = self._factories.pop(placeholder, None)
+        if factory is None:
+            return
+        view = factory()
+        placeholder.layout().addWidget(view)
+        self._views[placeholder] = view
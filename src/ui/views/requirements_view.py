@@ -1,15 +1,55 @@
 from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QMessageBox, QLineEdit, QLabel, QListWidget, QListWidgetItem,
-    QTextBrowser, QScrollArea, QFormLayout, QGroupBox
+    QMessageBox, QLineEdit, QLabel, QListView,
+    QTextBrowser, QTextEdit, QScrollArea, QFormLayout, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QItemSelectionModel, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QTextCursor
+from datetime import datetime
+from html import escape
+from functools import lru_cache
 from typing import List, Optional
 from controllers.requirement_controller import RequirementController
 from controllers.design_controller import DesignController
 from models.requirement import Requirement
 from ui.dialogs.requirement_dialog import RequirementDialog
-import markdown
+from ui.models.requirement_list_model import RequirementListModel
+
+
+# Built once, on first render; markdown.markdown() would load the extensions
+# on every call, and importing markdown pulls in pygments for codehilite
+_MARKDOWN = None
+
+
+def _markdown():
+    """Get the shared Markdown converter, importing markdown on first use"""
+    global _MARKDOWN
+    if _MARKDOWN is None:
+        import markdown
+        _MARKDOWN = markdown.Markdown(extensions=['extra', 'codehilite', 'fenced_code', 'tables'])
+    return _MARKDOWN
+
+
+@lru_cache(maxsize=512)
+def _render_description(description: str) -> str:
+    """Render a requirement description to HTML, reusing results for unchanged text"""
+    return _markdown().reset().convert(description)
+
+
+# Property panel priority styles, formatted once instead of per selection
+_PRIORITY_STYLESHEETS = {
+    "Critical": "color: #d32f2f; font-weight: bold;",
+    "High": "color: #f57c00; font-weight: bold;",
+    "Medium": "color: #fbc02d; font-weight: bold;",
+    "Low": "color: #388e3c; font-weight: bold;",
+}
+_DEFAULT_PRIORITY_STYLESHEET = "color: #000; font-weight: bold;"
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp for the property view, reusing results across selections"""
+    return timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
 
 class RequirementsView(QWidget):
@@ -29,10 +69,17 @@ class RequirementsView(QWidget):
         super().__init__(parent)
         self.controller = controller
         self.design_controller = design_controller
-        self.controller.add_observer(self.refresh_table)
+
+        # Bursts of refresh requests, such as several data_changed
+        # notifications, collapse into one refresh on the next event loop pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_now)
+        self.controller.data_changed.connect(self.refresh_table)
 
         self._init_ui()
-        self.refresh_table()
+        self._refresh_now()
 
     def _init_toolbar(self):
         toolbar = QHBoxLayout()
@@ -43,10 +90,16 @@ class RequirementsView(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by ID, title, or description...")
-        self.search_input.textChanged.connect(self._on_search)
+        self.search_input.textChanged.connect(self._schedule_search)
         self.search_input.setMaximumWidth(300)
         toolbar.addWidget(self.search_input)
 
+        # Search once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._run_search)
+
         toolbar.addStretch()
 
         # Action buttons
@@ -75,11 +128,15 @@ class RequirementsView(QWidget):
         nav_label.setStyleSheet("font-weight: bold; padding: 5px;")
         navigator_layout.addWidget(nav_label)
         
-        # List widget for requirements
-        self.navigator_list = QListWidget()
+        # List view for requirements
+        self.navigator_model = RequirementListModel(self.controller, self)
+        self.navigator_list = QListView()
+        self.navigator_list.setModel(self.navigator_model)
         self.navigator_list.setAlternatingRowColors(True)
-        self.navigator_list.itemSelectionChanged.connect(self._on_navigator_selection_changed)
-        self.navigator_list.itemDoubleClicked.connect(self._on_edit)
+        self.navigator_list.selectionModel().selectionChanged.connect(
+            self._on_navigator_selection_changed
+        )
+        self.navigator_list.doubleClicked.connect(self._on_edit)
         navigator_layout.addWidget(self.navigator_list)
         
         self.navigator = QWidget()
@@ -111,6 +168,7 @@ class RequirementsView(QWidget):
         
         self.prop_id_label = QLabel("-")
         self.prop_title_label = QLabel("-")
+        self.prop_title_label.setWordWrap(True)
         self.prop_category_label = QLabel("-")
         
         self.basic_info_layout.addRow("ID:", self.prop_id_label)
@@ -183,26 +241,33 @@ class RequirementsView(QWidget):
         contents_label.setStyleSheet("font-weight: bold; padding: 5px;")
         contents_layout.addWidget(contents_label)
         
-        # Scroll area for multiple requirements
-        self.contents_scroll = QScrollArea()
-        self.contents_scroll.setWidgetResizable(True)
-        self.contents_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.contents_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
-        # Container widget for all requirement descriptions
-        self.contents_container = QWidget()
-        self.contents_container_layout = QVBoxLayout(self.contents_container)
-        self.contents_container_layout.setSpacing(20)
-        self.contents_container_layout.addStretch()
-        
-        self.contents_scroll.setWidget(self.contents_container)
-        contents_layout.addWidget(self.contents_scroll)
+        # One browser holds every requirement description, anchored by ID
+        self.contents_browser = QTextBrowser()
+        self.contents_browser.setOpenExternalLinks(True)
+        self.contents_browser.document().setDefaultStyleSheet("body { font-family: sans-serif; }")
+        self.contents_browser.document().setUndoRedoEnabled(False)
+        contents_layout.addWidget(self.contents_browser)
         
         self.contents_view = QWidget()
         self.contents_view.setLayout(contents_layout)
         
-        # Dictionary to store text browsers by requirement ID
-        self.content_browsers = {}
+        # Cursor selecting each requirement's section of the document
+        self.content_sections = {}
+        # Placeholder cursor and Markdown text of descriptions not yet rendered
+        self._pending_descriptions = {}
+        # Fields of the requirements the document was last built from
+        self._shown_contents = None
+        # Requirement whose section is currently highlighted
+        self._highlighted_req_id: Optional[str] = None
+
+        # Render descriptions as they scroll into view, once scrolling settles
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(50)
+        self._render_timer.timeout.connect(self._render_visible_descriptions)
+        scroll_bar = self.contents_browser.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_render)
+        scroll_bar.rangeChanged.connect(self._schedule_render)
 
     def _init_main_view(self):
         self.main_view = QHBoxLayout()
@@ -230,8 +295,14 @@ class RequirementsView(QWidget):
         layout.addWidget(self.status_label)
 
     def refresh_table(self):
+        """Schedule a refresh of the view with current requirements"""
+        self._refresh_timer.start()
+
+    def _refresh_now(self):
         """Refresh view with current requirements"""
-        requirements = self.controller.get_all_requirements()
+        self._refresh_timer.stop()
+        # The list only shows ID and title, so design links are not needed
+        requirements = self.controller.get_all_requirements(load_links=False)
         self._populate_navigator(requirements)
         
         # Update status
@@ -241,82 +312,134 @@ class RequirementsView(QWidget):
 
     def _populate_navigator(self, requirements: List[Requirement]):
         """Populate navigator with requirements"""
-        self.navigator_list.clear()
-        
-        for req in requirements:
-            item_text = f"{req.id}: {req.title}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, req.id)
-            self.navigator_list.addItem(item)
-        
-        # Populate contents view
-        self._populate_contents(requirements)
+        current_id = self._current_requirement_id()
+        selection_model = self.navigator_list.selectionModel()
+
+        # Rebuild without repaints or per-row selection signals
+        self.navigator_list.setUpdatesEnabled(False)
+        self.contents_browser.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            self.navigator_model.set_requirements(requirements)
+            # Kept rows keep their selection; a removed current row selects nothing
+            # rather than letting the current index slide onto a neighbour
+            if current_id is not None and self.navigator_model.row_of(current_id) < 0:
+                selection_model.clear()
+
+            # Populate contents view
+            self._populate_contents(requirements)
+        finally:
+            selection_model.blockSignals(False)
+            self.contents_browser.setUpdatesEnabled(True)
+            self.navigator_list.setUpdatesEnabled(True)
+
+        # Selection signals were blocked, so sync the views with it once, after
+        # the contents exist to scroll to
+        self._on_navigator_selection_changed()
 
     def _populate_contents(self, requirements: List[Requirement]):
         """Populate contents view with all requirement descriptions"""
-        # Clear existing content browsers
-        for browser in self.content_browsers.values():
-            browser.deleteLater()
-        self.content_browsers.clear()
-        
-        # Clear layout
-        while self.contents_container_layout.count() > 1:  # Keep the stretch
-            item = self.contents_container_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add requirement descriptions
+        # Keep the current document, with its rendered descriptions, when
+        # nothing it shows has changed
+        shown = [(req.id, req.title, req.status, req.priority, req.category, req.description)
+                 for req in requirements]
+        if shown == self._shown_contents:
+            return
+        self._shown_contents = shown
+
+        self.content_sections.clear()
+        self._pending_descriptions.clear()
+        self._highlighted_req_id = None
+
+        sections = []
         for req in requirements:
-            # Create a container for each requirement
-            req_widget = QWidget()
-            req_widget.setObjectName(f"req_{req.id}")
-            req_layout = QVBoxLayout(req_widget)
-            req_layout.setContentsMargins(10, 10, 10, 10)
-            
-            # Requirement header
-            header_label = QLabel(f"<h3>{req.id}: {req.title}</h3>")
-            header_label.setTextFormat(Qt.TextFormat.RichText)
-            req_layout.addWidget(header_label)
-            
-            # Metadata
-            meta_text = f"<p><strong>Status:</strong> {req.status.value} | "
-            meta_text += f"<strong>Priority:</strong> {req.priority.value} | "
-            meta_text += f"<strong>Category:</strong> {req.category}</p>"
-            meta_label = QLabel(meta_text)
-            meta_label.setTextFormat(Qt.TextFormat.RichText)
-            meta_label.setStyleSheet("color: #666; font-size: 10pt;")
-            req_layout.addWidget(meta_label)
-            
-            # Description with Markdown rendering
-            browser = QTextBrowser()
-            browser.setOpenExternalLinks(True)
-            browser.setMinimumHeight(150)
-            
-            # Convert Markdown to HTML
+            # Requirement header and metadata
+            section = f'<h3><a name="{req.id}"></a>{req.id}: {escape(req.title)}</h3>'
+            section += '<p style="color: #666; font-size: 10pt;">'
+            section += f"<strong>Status:</strong> {req.status.value} | "
+            section += f"<strong>Priority:</strong> {req.priority.value} | "
+            section += f"<strong>Category:</strong> {escape(req.category)}</p>"
+
+            # Description, rendered from Markdown once it scrolls into view
             if req.description:
-                html_content = markdown.markdown(
-                    req.description,
-                    extensions=['extra', 'codehilite', 'fenced_code', 'tables']
-                )
-                browser.setHtml(f"<style>body {{ font-family: sans-serif; }}</style>{html_content}")
+                section += f'<p><a name="desc-{req.id}"></a><em>Loading description...</em></p>'
+            else:
+                section += "<p><em>No description provided.</em></p>"
+
+            sections.append(section + "<hr/>")
+        self.contents_browser.setHtml("".join(sections))
+
+        # Cursors follow later edits, so these ranges stay correct as
+        # descriptions above them are rendered
+        document = self.contents_browser.document()
+        anchors = self._anchor_positions()
+        for i, req in enumerate(requirements):
+            section = QTextCursor(document)
+            section.setPosition(anchors[req.id])
+            if i + 1 < len(requirements):
+                section.setPosition(anchors[requirements[i + 1].id] - 1, QTextCursor.MoveMode.KeepAnchor)
             else:
-                browser.setHtml("<p><em>No description provided.</em></p>")
-            
-            req_layout.addWidget(browser)
-            
-            # Add separator
-            separator = QLabel()
-            separator.setStyleSheet("border-bottom: 1px solid #ccc; margin: 10px 0;")
-            req_layout.addWidget(separator)
-            
-            # Insert before stretch
-            self.contents_container_layout.insertWidget(
-                self.contents_container_layout.count() - 1, 
-                req_widget
-            )
-            
-            # Store browser reference
-            self.content_browsers[req.id] = req_widget
+                section.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+            self.content_sections[req.id] = section
+
+            if req.description:
+                placeholder = QTextCursor(document)
+                placeholder.setPosition(anchors[f"desc-{req.id}"])
+                placeholder.movePosition(QTextCursor.MoveOperation.StartOfBlock)
+                placeholder.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+                self._pending_descriptions[req.id] = (placeholder, req.description)
+
+        self._render_timer.start()
+
+    def _anchor_positions(self) -> dict:
+        """Get the document position of every named anchor in the contents view"""
+        positions = {}
+        block = self.contents_browser.document().begin()
+        while block.isValid():
+            fragments = block.begin()
+            while not fragments.atEnd():
+                fragment = fragments.fragment()
+                for name in fragment.charFormat().anchorNames():
+                    positions[name] = fragment.position()
+                fragments += 1
+            block = block.next()
+        return positions
+
+    def _schedule_render(self):
+        """Restart the delay before rendering descriptions in view"""
+        self._render_timer.start()
+
+    def _render_visible_descriptions(self):
+        """Render the pending descriptions shown in the contents viewport"""
+        browser = self.contents_browser
+        viewport = browser.viewport().rect()
+        # Rendering grows the sections in view, so repeat until none are pending
+        while self._pending_descriptions:
+            top = browser.cursorForPosition(viewport.topLeft()).position()
+            bottom = browser.cursorForPosition(viewport.bottomRight()).position()
+            visible = [req_id for req_id, (placeholder, _) in self._pending_descriptions.items()
+                       if top <= placeholder.selectionEnd() and placeholder.selectionStart() <= bottom]
+            if not visible:
+                break
+            for req_id in visible:
+                self._render_description_now(req_id)
+
+    def _render_description_now(self, req_id: str):
+        """Replace a requirement's description placeholder with its rendered Markdown"""
+        pending = self._pending_descriptions.pop(req_id, None)
+        if pending is None:
+            return
+        placeholder, description = pending
+        start = placeholder.selectionStart()
+
+        # The inserted HTML's first block merges into the placeholder's block
+        # and takes its format, so lead with a marker paragraph and remove it
+        # afterwards; the rendered blocks then keep their own formats
+        placeholder.insertHtml("<p>\u200b</p>" + _render_description(description))
+        marker = QTextCursor(self.contents_browser.document())
+        marker.setPosition(start - 1)
+        marker.setPosition(start + 1, QTextCursor.MoveMode.KeepAnchor)
+        marker.removeSelectedText()
 
     def _update_property_view(self, req_id: str):
         """Update property view with selected requirement details"""
@@ -329,7 +452,6 @@ class RequirementsView(QWidget):
         # Basic Information
         self.prop_id_label.setText(requirement.id)
         self.prop_title_label.setText(requirement.title)
-        self.prop_title_label.setWordWrap(True)
         self.prop_category_label.setText(requirement.category)
         
         # Status
@@ -337,18 +459,12 @@ class RequirementsView(QWidget):
         self.prop_priority_label.setText(requirement.priority.value)
         
         # Apply color based on priority
-        priority_colors = {
-            "Critical": "#d32f2f",
-            "High": "#f57c00",
-            "Medium": "#fbc02d",
-            "Low": "#388e3c"
-        }
-        priority_color = priority_colors.get(requirement.priority.value, "#000")
-        self.prop_priority_label.setStyleSheet(f"color: {priority_color}; font-weight: bold;")
+        self.prop_priority_label.setStyleSheet(
+            _PRIORITY_STYLESHEETS.get(requirement.priority.value, _DEFAULT_PRIORITY_STYLESHEET))
         
         # Timestamps
-        self.prop_created_label.setText(requirement.created_at.strftime("%Y-%m-%d %H:%M:%S"))
-        self.prop_updated_label.setText(requirement.updated_at.strftime("%Y-%m-%d %H:%M:%S"))
+        self.prop_created_label.setText(_format_timestamp(requirement.created_at))
+        self.prop_updated_label.setText(_format_timestamp(requirement.updated_at))
         
         # Links
         # if requirement.linked_design_ids:
@@ -388,9 +504,8 @@ class RequirementsView(QWidget):
 
     def _on_navigator_selection_changed(self):
         """Handle navigator selection change"""
-        current_item = self.navigator_list.currentItem()
-        if current_item:
-            req_id = current_item.data(Qt.ItemDataRole.UserRole)
+        req_id = self._current_requirement_id()
+        if req_id:
             self._scroll_to_requirement(req_id)
             self._update_property_view(req_id)
             self.edit_button.setEnabled(True)
@@ -401,46 +516,41 @@ class RequirementsView(QWidget):
             self.edit_button.setEnabled(False)
             self.delete_button.setEnabled(False)
 
+    def _current_requirement_id(self) -> Optional[str]:
+        """Get the ID of the requirement selected in the navigator"""
+        index = self.navigator_list.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(Qt.ItemDataRole.UserRole)
+
     def _scroll_to_requirement(self, req_id: str):
         """Scroll to the requirement in contents view"""
-        if req_id in self.content_browsers:
-            widget = self.content_browsers[req_id]
-            self.contents_scroll.ensureWidgetVisible(widget)
-            # Highlight the selected requirement temporarily
-            widget.setStyleSheet("background-color: #e3f2fd; border-radius: 5px;")
-            # Reset other highlights
-            for other_id, other_widget in self.content_browsers.items():
-                if other_id != req_id:
-                    other_widget.setStyleSheet("")
-
-    def _select_requirement_in_table(self, req_id: str):
-        """Select requirement in table by ID"""
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).text() == req_id:
-                self.table.selectRow(row)
-                break
-
-    def _on_selection_changed(self):
-        """Handle selection change"""
-        has_selection = len(self.table.selectedItems()) > 0
-        self.edit_button.setEnabled(has_selection)
-        self.delete_button.setEnabled(has_selection)
+        section = self.content_sections.get(req_id)
+        if section is None:
+            return
+        self._render_description_now(req_id)
+        self.contents_browser.scrollToAnchor(req_id)
 
-        if has_selection:
-            req_id = self.table.item(self.table.currentRow(), 0).text()
-            self._select_requirement_in_navigator(req_id)
-            self._update_property_view(req_id)
-            self.requirement_selected.emit(req_id)
-        else:
-            self._clear_property_view()
+        # Highlight the selected requirement, replacing any previous highlight;
+        # reselecting the highlighted one leaves the viewport's formats alone
+        if req_id == self._highlighted_req_id:
+            return
+        self._highlighted_req_id = req_id
+        highlight = QTextEdit.ExtraSelection()
+        highlight.cursor = QTextCursor(section)
+        highlight.format.setBackground(QColor("#e3f2fd"))
+        self.contents_browser.setExtraSelections([highlight])
 
     def _select_requirement_in_navigator(self, req_id: str):
         """Select requirement in navigator by ID"""
-        for i in range(self.navigator_list.count()):
-            item = self.navigator_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == req_id:
-                self.navigator_list.setCurrentItem(item)
-                break
+        row = self.navigator_model.row_of(req_id)
+        if row < 0 or req_id == self._current_requirement_id():
+            return
+        # One ClearAndSelect call, so listeners see a single selection change
+        self.navigator_list.selectionModel().setCurrentIndex(
+            self.navigator_model.index(row),
+            QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
 
     def _on_new(self):
         """Handle new requirement button"""
@@ -456,17 +566,15 @@ class RequirementsView(QWidget):
 
             if success:
                 QMessageBox.information(self, "Success", message)
-                self.refresh_table()
             else:
                 QMessageBox.critical(self, "Error", message)
 
     def _on_edit(self):
         """Handle edit button"""
-        current_item = self.navigator_list.currentItem()
-        if not current_item:
+        req_id = self._current_requirement_id()
+        if not req_id:
             return
 
-        req_id = current_item.data(Qt.ItemDataRole.UserRole)
         requirement = self.controller.manager.get_requirement(req_id)
 
         if requirement is None:
@@ -485,17 +593,15 @@ class RequirementsView(QWidget):
 
             if success:
                 QMessageBox.information(self, "Success", message)
-                self.refresh_table()
             else:
                 QMessageBox.critical(self, "Error", message)
 
     def _on_delete(self):
         """Handle delete button"""
-        current_item = self.navigator_list.currentItem()
-        if not current_item:
+        req_id = self._current_requirement_id()
+        if not req_id:
             return
 
-        req_id = current_item.data(Qt.ItemDataRole.UserRole)
         requirement = self.controller.manager.get_requirement(req_id)
         
         if requirement is None:
@@ -515,17 +621,24 @@ class RequirementsView(QWidget):
 
             if success:
                 QMessageBox.information(self, "Success", message)
-                self.refresh_table()
             else:
                 QMessageBox.critical(self, "Error", message)
 
+    def _schedule_search(self, query: str):
+        """Restart the search delay after the search text changes"""
+        self._search_timer.start()
+
+    def _run_search(self):
+        """Search with the text entered once the search delay expires"""
+        self._on_search(self.search_input.text())
+
     def _on_search(self, query: str):
         """Handle search text change"""
         if not query.strip():
             self.refresh_table()
             return
 
-        requirements = self.controller.search_requirements(query)
+        requirements = self.controller.search_requirements(query, load_links=False)
         self._populate_navigator(requirements)
         
         # Update status
@@ -1,6 +1,25 @@
-from PyQt6.QtWidgets import QToolBar, QMessageBox
+from PyQt6.QtWidgets import QToolBar, QMessageBox, QWidget
 from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtCore import pyqtSignal, Qt, QSize
+from functools import partial
+from typing import NamedTuple
+
+
+class _ActionSpec(NamedTuple):
+    """Toolbar action; triggering it emits the toolbar's <name>_triggered signal"""
+    name: str
+    text: str
+    shortcut: str
+    status_tip: str
+    placeholder: str
+
+
+_ACTION_SPECS = (
+    _ActionSpec('save', "Save", "Ctrl+S", "Save current work", "Save functionality will be implemented"),
+    _ActionSpec('export', "Export", "Ctrl+E", "Export data", "Export functionality will be implemented"),
+    _ActionSpec('settings', "Settings", "Ctrl+,", "Open settings", "Settings dialog will be implemented"),
+)
+_ACTION_SPEC_BY_NAME = {spec.name: spec for spec in _ACTION_SPECS}
 
 
 class ToolBar(QToolBar):
@@ -22,60 +41,40 @@ class ToolBar(QToolBar):
         self.setMovable(False)
         self.setFloatable(False)
         self.setIconSize(QSize(24, 24))
-        self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
+        # No action has an icon until set_icon is called
+        self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
     
     def _create_actions(self):
         """Create toolbar actions."""
-        # Save Action
-        self.save_action = QAction("Save", self)
-        self.save_action.setShortcut("Ctrl+S")
-        self.save_action.setStatusTip("Save current work")
-        self.addAction(self.save_action)
-        
-        self.addSeparator()
-        
-        # Export Action
-        self.export_action = QAction("Export", self)
-        self.export_action.setShortcut("Ctrl+E")
-        self.export_action.setStatusTip("Export data")
-        self.addAction(self.export_action)
-        
-        self.addSeparator()
-        
-        # Settings Action
-        self.settings_action = QAction("Settings", self)
-        self.settings_action.setShortcut("Ctrl+,")
-        self.settings_action.setStatusTip("Open settings")
-        self.addAction(self.settings_action)
+        self._actions = {}
+        for index, spec in enumerate(_ACTION_SPECS):
+            if index:
+                self.addSeparator()
+            action = QAction(spec.text, self)
+            action.setShortcut(spec.shortcut)
+            action.setStatusTip(spec.status_tip)
+            self.addAction(action)
+            self._actions[spec.name] = action
+
+        self.save_action = self._actions['save']
+        self.export_action = self._actions['export']
+        self.settings_action = self._actions['settings']
         
         # Add spacer to push remaining items to the right
-        spacer = QToolBar(self)
+        spacer = QWidget(self)
         spacer.setFixedWidth(20)
         self.addWidget(spacer)
     
     def _connect_signals(self):
         """Connect action signals to toolbar signals."""
-        self.save_action.triggered.connect(self._on_save)
-        self.export_action.triggered.connect(self._on_export)
-        self.settings_action.triggered.connect(self._on_settings)
+        for name, action in self._actions.items():
+            action.triggered.connect(partial(self._on_action, name))
     
-    def _on_save(self):
-        """Handle save action"""
-        # TODO: Implement save functionality
-        QMessageBox.information(self, "Save", "Save functionality will be implemented")
-        self.save_triggered.emit()
-    
-    def _on_export(self):
-        """Handle export action"""
-        # TODO: Implement export functionality
-        QMessageBox.information(self, "Export", "Export functionality will be implemented")
-        self.export_triggered.emit()
-    
-    def _on_settings(self):
-        """Handle settings action"""
-        # TODO: Implement settings dialog
-        QMessageBox.information(self, "Settings", "Settings dialog will be implemented")
-        self.settings_triggered.emit()
+    def _on_action(self, name: str):
+        """Handle a toolbar action"""
+        spec = _ACTION_SPEC_BY_NAME[name]
+        QMessageBox.information(self, spec.text, spec.placeholder)
+        getattr(self, f"{name}_triggered").emit()
     
     def set_save_enabled(self, enabled: bool):
         """Enable or disable the save action."""
@@ -92,11 +91,6 @@ class ToolBar(QToolBar):
             action_name: Name of the action ('save', 'export', or 'settings')
             icon: QIcon to set for the action
         """
-        action_map = {
-            'save': self.save_action,
-            'export': self.export_action,
-            'settings': self.settings_action
-        }
-        
-        if action_name in action_map:
-            action_map[action_name].setIcon(icon)
+        if action_name in self._actions:
+            self._actions[action_name].setIcon(icon)
+            self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
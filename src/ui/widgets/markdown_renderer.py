@@ -0,0 +1,364 @@
+import base64
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# markdown, pygments and plantuml are imported on first render, keeping
+# them out of application startup
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+
+
+# Fenced PlantUML blocks in the Markdown source
+_PLANTUML_RE = re.compile(r'```plantuml\n(.*?)```', re.DOTALL)
+
+_MARKDOWN_EXTENSIONS = [
+    'fenced_code',
+    'tables',
+    'nl2br',
+    'sane_lists'
+]
+
+# Stylesheet of rendered pages, set once as the viewer document's default
+# stylesheet so that each render only parses the page content; the
+# Pygments token styles are added when the renderer is built
+_STYLESHEET = """\
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+    font-size: 14px;
+    line-height: 1.6;
+    color: #333;
+    padding: 10px;
+    background-color: #ffffff;
+}
+h1, h2, h3, h4, h5, h6 {
+    margin-top: 24px;
+    margin-bottom: 16px;
+    font-weight: 600;
+    line-height: 1.25;
+}
+h1 { font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
+h2 { font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }
+h3 { font-size: 1.25em; }
+code {
+    padding: 0.2em 0.4em;
+    margin: 0;
+    font-size: 85%;
+    background-color: rgba(27,31,35,0.05);
+    border-radius: 3px;
+    font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
+}
+pre {
+    padding: 16px;
+    overflow: auto;
+    font-size: 85%;
+    line-height: 1.45;
+    background-color: #f6f8fa;
+    border-radius: 3px;
+    font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
+}
+pre code {
+    display: inline;
+    padding: 0;
+    margin: 0;
+    overflow: visible;
+    line-height: inherit;
+    background-color: transparent;
+    border: 0;
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 16px 0;
+}
+table th, table td {
+    padding: 6px 13px;
+    border: 1px solid #dfe2e5;
+}
+table tr {
+    background-color: #fff;
+    border-top: 1px solid #c6cbd1;
+}
+blockquote {
+    padding: 0 1em;
+    color: #6a737d;
+    border-left: 0.25em solid #dfe2e5;
+    margin: 0 0 16px 0;
+}
+a {
+    color: #0366d6;
+    text-decoration: none;
+}
+a:hover {
+    text-decoration: underline;
+}
+img {
+    max-width: 100%;
+    box-sizing: content-box;
+    background-color: #fff;
+}
+.highlight {
+    margin: 16px 0;
+}
+"""
+
+# Diagrams are fetched in parallel, each worker thread with a PlantUML
+# client of its own since a client's HTTP connection is not thread-safe
+_DIAGRAM_POOL = QThreadPool()
+_DIAGRAM_POOL.setMaxThreadCount(8)
+_diagram_clients = threading.local()
+
+
+class _DiagramSignals(QObject):
+    """Carries a generated diagram back to the renderer's thread"""
+
+    finished = pyqtSignal(str, object)  # UML source, base64 image or None
+
+
+class _DiagramJob(QRunnable):
+    """Generates one PlantUML diagram off the UI thread"""
+
+    def __init__(self, generate: Callable[[str], Optional[str]], uml_code: str):
+        super().__init__()
+        self.signals = _DiagramSignals()
+        self._generate = generate
+        self._uml_code = uml_code
+
+    def run(self):
+        self.signals.finished.emit(self._uml_code, self._generate(self._uml_code))
+
+
+def prewarm_renderer():
+    """Import the rendering libraries ahead of the first render; safe to run on a worker thread"""
+    import markdown
+    import plantuml
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+
+    # Both load further modules on first use
+    markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
+    get_lexer_by_name('python')
+
+
+class MarkdownRenderer(QObject):
+    """Renders markdown to styled HTML pages, with caches shared by every viewer"""
+
+    # Emitted when a diagram finishes; pages rendered with placeholders can
+    # be rendered again to show it
+    diagrams_ready = pyqtSignal()
+
+    # Number of rendered pages kept for texts shown again
+    HTML_CACHE_SIZE = 32
+    # Number of generated diagrams kept for blocks rendered again
+    DIAGRAM_CACHE_SIZE = 64
+    # Number of highlighted code blocks kept for snippets seen again
+    SNIPPET_CACHE_SIZE = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # HTML of recently rendered texts, least recently used first
+        self._html_cache: OrderedDict[str, str] = OrderedDict()
+        # Base64 images of recently generated PlantUML sources, None for
+        # sources that failed to generate
+        self._diagram_cache: OrderedDict[str, Optional[str]] = OrderedDict()
+        # Signals of diagrams being generated, by source
+        self._diagram_jobs: Dict[str, _DiagramSignals] = {}
+
+        # Lexer per language name, or None for names Pygments does not know
+        self._lexers: Dict[str, Optional["Lexer"]] = {}
+        # Highlighted HTML of recent code blocks by language and code, None
+        # for blocks left as they are
+        self._snippets: OrderedDict[Tuple[str, str], Optional[str]] = OrderedDict()
+
+        # Converter, highlighter and PlantUML client, built on first render
+        self._md = None
+
+    def _init_renderer(self):
+        """Import the rendering libraries and build the rendering state"""
+        import markdown
+        import plantuml
+        from pygments.formatters import HtmlFormatter
+        from ui.widgets.fenced_code_highlight import HighlightFencedCode
+
+        # Highlighting state shared by every code block
+        # Token styles are emitted once as CSS rather than inline on every span
+        self._formatter = HtmlFormatter(style='monokai', cssclass='highlight')
+        self._stylesheet = _STYLESHEET + self._formatter.get_style_defs('.highlight')
+
+        # Built once; markdown.markdown() would load the extensions on every call
+        self._md = markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
+        self._md.preprocessors.register(
+            HighlightFencedCode(self._md, self._highlight_code),
+            'highlight_fenced_code', HighlightFencedCode.PRIORITY)
+
+        # Initialize PlantUML
+        try:
+            self.plantuml = plantuml.PlantUML(url='http://www.plantuml.com/plantuml/img/')
+        except:
+            self.plantuml = None
+
+    def stylesheet(self) -> str:
+        """Get the stylesheet the rendered HTML is meant to be shown with"""
+        if self._md is None:
+            self._init_renderer()
+        return self._stylesheet
+
+    def cached_page(self, text: str) -> Optional[str]:
+        """Get the page of a text rendered before, if it is still cached"""
+        cached = self._html_cache.get(text)
+        if cached is not None:
+            self._html_cache.move_to_end(text)
+        return cached
+
+    def render_page(self, text: str) -> Tuple[str, bool]:
+        """
+        Render markdown to HTML
+
+        Returns:
+            The HTML, and whether it shows placeholders for diagrams that
+            are still being generated
+        """
+        cached = self.cached_page(text)
+        if cached is not None:
+            return cached, False
+
+        html, pending = self.render_fragment(text)
+        # Pages still waiting for diagrams are rendered again, not reused
+        if not pending:
+            self._html_cache[text] = html
+            if len(self._html_cache) > self.HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+        return html, pending
+
+    def render_fragment(self, text: str) -> Tuple[str, bool]:
+        """Render markdown to HTML without caching it, as render_page does"""
+        if self._md is None:
+            self._init_renderer()
+        body, pending = self._convert(text)
+        # The body element is kept so the stylesheet's body rule applies
+        return f"<body>{body}</body>", pending
+
+    def _convert(self, text: str) -> Tuple[str, bool]:
+        """Convert markdown to highlighted HTML, noting whether diagrams are pending"""
+        # Process PlantUML blocks first
+        source, pending = self._process_plantuml(text)
+
+        # Convert markdown to HTML with extensions; fenced code is
+        # highlighted as it is parsed
+        return self._md.reset().convert(source), pending
+
+    def _process_plantuml(self, text: str) -> Tuple[str, bool]:
+        """
+        Process PlantUML code blocks and replace with rendered images
+
+        Returns:
+            The text with blocks replaced, and whether any of its diagrams
+            are still being generated
+        """
+        if not self.plantuml:
+            return text, False
+
+        pending = False
+
+        def render_diagram(match):
+            nonlocal pending
+            uml_code = match.group(1)
+            if uml_code not in self._diagram_cache:
+                # Generated in the background; viewers render the page
+                # again once the image arrives
+                self._request_diagram(uml_code)
+                pending = True
+                return '<p><em>Rendering diagram...</em></p>'
+            self._diagram_cache.move_to_end(uml_code)
+            img_data = self._diagram_cache[uml_code]
+            if not img_data:
+                return match.group(0)
+            # Replace code block with image
+            return f'<img src="data:image/png;base64,{img_data}" style="max-width: 100%;" />'
+
+        # Replace all PlantUML blocks in one pass
+        return _PLANTUML_RE.sub(render_diagram, text), pending
+
+    def _request_diagram(self, uml_code: str):
+        """Start generating a diagram on a diagram thread unless already underway"""
+        if uml_code in self._diagram_jobs:
+            return
+        job = _DiagramJob(self._generate_plantuml_image, uml_code)
+        job.signals.finished.connect(self._on_diagram_finished)
+        self._diagram_jobs[uml_code] = job.signals
+        _DIAGRAM_POOL.start(job)
+
+    def _on_diagram_finished(self, uml_code: str, img_data: Optional[str]):
+        """Store a generated diagram and let viewers show it"""
+        del self._diagram_jobs[uml_code]
+        self._diagram_cache[uml_code] = img_data
+        if len(self._diagram_cache) > self.DIAGRAM_CACHE_SIZE:
+            self._diagram_cache.popitem(last=False)
+        self.diagrams_ready.emit()
+
+    def _generate_plantuml_image(self, uml_code: str) -> Optional[str]:
+        """Generate PlantUML image and return as base64; runs on a diagram thread"""
+        try:
+            client = getattr(_diagram_clients, 'client', None)
+            if client is None:
+                import plantuml
+                client = _diagram_clients.client = plantuml.PlantUML(url=self.plantuml.url)
+            # The client deflates the source into the request URL itself,
+            # so no files are written
+            png = client.processes(f'@startuml\n{uml_code}\n@enduml')
+            return base64.b64encode(png).decode('utf-8')
+        except Exception as e:
+            print(f"PlantUML generation failed: {e}")
+            return None
+
+    def _highlight_code(self, lang: str, code: str) -> Optional[str]:
+        """Highlight a fenced code block, or return None to leave it as it is"""
+        key = (lang, code)
+        if key in self._snippets:
+            self._snippets.move_to_end(key)
+            return self._snippets[key]
+
+        highlighted = self._highlight_uncached(lang, code)
+        self._snippets[key] = highlighted
+        if len(self._snippets) > self.SNIPPET_CACHE_SIZE:
+            self._snippets.popitem(last=False)
+        return highlighted
+
+    def _highlight_uncached(self, lang: str, code: str) -> Optional[str]:
+        """Run Pygments over a code block"""
+        from pygments import highlight
+        from pygments.lexers import guess_lexer
+
+        lexer = self._lexer_for(lang)
+        if lexer is None:
+            try:
+                lexer = guess_lexer(code)
+            except:
+                return None
+        return highlight(code, lexer, self._formatter)
+
+    def _lexer_for(self, lang: str) -> Optional["Lexer"]:
+        """Get the lexer for a language name, looking each name up once"""
+        if lang not in self._lexers:
+            from pygments.lexers import get_lexer_by_name
+            from pygments.util import ClassNotFound
+
+            try:
+                self._lexers[lang] = get_lexer_by_name(lang, stripall=True)
+            except ClassNotFound:
+                self._lexers[lang] = None
+        return self._lexers[lang]
+
+
+_RENDERER: Optional[MarkdownRenderer] = None
+
+
+def shared_renderer() -> MarkdownRenderer:
+    """Get the renderer shared by all markdown viewers, creating it on first use"""
+    global _RENDERER
+    if _RENDERER is None:
+        _RENDERER = MarkdownRenderer()
+    return _RENDERER
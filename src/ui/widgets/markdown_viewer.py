@@ -1,244 +1,136 @@
 from PyQt6.QtWidgets import QTextBrowser
 from PyQt6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat
-from PyQt6.QtCore import Qt, QUrl
-import markdown
-from markdown.extensions import fenced_code, tables, nl2br
-from pygments import highlight
-from pygments.lexers import get_lexer_by_name, guess_lexer
-from pygments.formatters import HtmlFormatter
-from pygments.util import ClassNotFound
-import plantuml
-import tempfile
+from PyQt6.QtCore import Qt, QTimer, QUrl
 import os
-import base64
 import re
+from typing import Optional
+from ui.widgets.markdown_renderer import shared_renderer
+
+
+# First character of text that starts a block independent of the ones before
+_APPENDABLE_START_RE = re.compile(r'[^\s>*+\-|\d\[]')
+# Opening or closing line of a fenced code block
+_FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})', re.MULTILINE)
+# Reference-style link definition, which applies to the whole document
+_REFERENCE_DEF_RE = re.compile(r'^\s{0,3}\[[^\]]+\]:', re.MULTILINE)
+
+
+def _ends_inside_fence(text: str) -> bool:
+    """Check whether text ends inside an unclosed fenced code block"""
+    opening = None
+    for match in _FENCE_RE.finditer(text):
+        fence = match.group(1)
+        if opening is None:
+            opening = fence
+        elif fence[0] == opening[0] and len(fence) >= len(opening):
+            opening = None
+    return opening is not None
 
 
 class MarkdownViewer(QTextBrowser):
     """Widget for rendering markdown with PlantUML and syntax highlighting"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, render_delay: int = 150):
         super().__init__(parent)
         self.setOpenExternalLinks(True)
         self.setReadOnly(True)
 
+        # Render only the last of a burst of set_markdown calls, once they
+        # have paused for render_delay ms
+        self._pending_text = ""
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(render_delay)
+        self._render_timer.timeout.connect(self._render_pending)
+
         # Setup font
         font = QFont("Consolas" if os.name == 'nt' else "Monaco")
         font.setPointSize(10)
         self.setFont(font)
 
-        # Initialize PlantUML
-        try:
-            self.plantuml = plantuml.PlantUML(url='http://www.plantuml.com/plantuml/img/')
-        except:
-            self.plantuml = None
+        # Converter, highlighter and caches are shared with the other viewers
+        self._renderer = shared_renderer()
+        self._renderer.diagrams_ready.connect(self._on_diagrams_ready)
+        # Whether the shown page has placeholders for diagrams still being generated
+        self._awaiting_diagrams = False
+
+        # Markdown text of the page being shown, and its HTML unless blocks
+        # were appended to it
+        self._shown_text = ""
+        self._shown_html: Optional[str] = ""
 
     def set_markdown(self, text: str):
-        """Set and render markdown content"""
+        """Set markdown content, rendering it once updates pause"""
+        self._pending_text = text
+        self._render_timer.start()
+
+    def flush(self):
+        """Render content set since the last render without waiting"""
+        if self._render_timer.isActive():
+            self._render_timer.stop()
+            self._render_pending()
+
+    def _render_pending(self):
+        """Render the most recently set content"""
+        self._render(self._pending_text)
+
+    def _render(self, text: str):
+        """Render markdown content"""
         if not text:
-            self.setHtml("")
+            self._shown_text = ""
+            self._awaiting_diagrams = False
+            self._show_page("")
             return
 
-        # Process PlantUML blocks first
-        text = self._process_plantuml(text)
-
-        # Convert markdown to HTML with extensions
-        html = markdown.markdown(
-            text,
-            extensions=[
-                'fenced_code',
-                'tables',
-                'nl2br',
-                'codehilite',
-                'sane_lists'
-            ],
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'linenums': False,
-                    'guess_lang': True
-                }
-            }
-        )
-
-        # Process code blocks for syntax highlighting
-        html = self._process_code_blocks(html)
-
-        # Wrap in styled HTML
-        styled_html = self._create_styled_html(html)
-        self.setHtml(styled_html)
-
-    def _process_plantuml(self, text: str) -> str:
-        """Process PlantUML code blocks and replace with rendered images"""
-        if not self.plantuml:
-            return text
-
-        # Find PlantUML blocks
-        pattern = r'```plantuml\n(.*?)```'
-        matches = re.finditer(pattern, text, re.DOTALL)
-
-        for match in reversed(list(matches)):
-            uml_code = match.group(1)
-            try:
-                # Generate PlantUML diagram
-                img_data = self._generate_plantuml_image(uml_code)
-                if img_data:
-                    # Replace code block with image
-                    img_tag = f'<img src="data:image/png;base64,{img_data}" style="max-width: 100%;" />'
-                    text = text[:match.start()] + img_tag + text[match.end():]
-            except Exception as e:
-                # If PlantUML fails, show error
-                error_msg = f'<div style="color: red;">PlantUML Error: {str(e)}</div>'
-                text = text[:match.start()] + error_msg + text[match.end():]
-
-        return text
-
-    def _generate_plantuml_image(self, uml_code: str) -> str:
-        """Generate PlantUML image and return as base64"""
-        try:
-            # Create temporary file for PlantUML
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.puml', delete=False) as f:
-                f.write('@startuml\n')
-                f.write(uml_code)
-                f.write('\n@enduml')
-                temp_path = f.name
-
-            # Generate image
-            output_path = temp_path.replace('.puml', '.png')
-            self.plantuml.processes_file(temp_path, outfile=output_path)
-
-            # Read and encode image
-            with open(output_path, 'rb') as img_file:
-                img_data = base64.b64encode(img_file.read()).decode('utf-8')
-
-            # Cleanup
-            os.unlink(temp_path)
-            os.unlink(output_path)
-
-            return img_data
-        except Exception as e:
-            print(f"PlantUML generation failed: {e}")
-            return None
-
-    def _process_code_blocks(self, html: str) -> str:
-        """Process code blocks for syntax highlighting"""
-        # Find code blocks with language specification
-        pattern = r'<code class="language-(\w+)">(.*?)</code>'
-
-        def highlight_code(match):
-            lang = match.group(1)
-            code = match.group(2)
-
-            # Unescape HTML entities
-            code = code.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-
-            try:
-                lexer = get_lexer_by_name(lang, stripall=True)
-            except ClassNotFound:
-                try:
-                    lexer = guess_lexer(code)
-                except:
-                    return match.group(0)
-
-            formatter = HtmlFormatter(style='monokai', noclasses=True)
-            highlighted = highlight(code, lexer, formatter)
-            return highlighted
-
-        html = re.sub(pattern, highlight_code, html, flags=re.DOTALL)
-        return html
-
-    def _create_styled_html(self, content: str) -> str:
-        """Wrap content in styled HTML"""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-                    font-size: 14px;
-                    line-height: 1.6;
-                    color: #333;
-                    padding: 10px;
-                    background-color: #ffffff;
-                }}
-                h1, h2, h3, h4, h5, h6 {{
-                    margin-top: 24px;
-                    margin-bottom: 16px;
-                    font-weight: 600;
-                    line-height: 1.25;
-                }}
-                h1 {{ font-size: 2em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }}
-                h2 {{ font-size: 1.5em; border-bottom: 1px solid #eaecef; padding-bottom: 0.3em; }}
-                h3 {{ font-size: 1.25em; }}
-                code {{
-                    padding: 0.2em 0.4em;
-                    margin: 0;
-                    font-size: 85%;
-                    background-color: rgba(27,31,35,0.05);
-                    border-radius: 3px;
-                    font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
-                }}
-                pre {{
-                    padding: 16px;
-                    overflow: auto;
-                    font-size: 85%;
-                    line-height: 1.45;
-                    background-color: #f6f8fa;
-                    border-radius: 3px;
-                    font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
-                }}
-                pre code {{
-                    display: inline;
-                    padding: 0;
-                    margin: 0;
-                    overflow: visible;
-                    line-height: inherit;
-                    background-color: transparent;
-                    border: 0;
-                }}
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 16px 0;
-                }}
-                table th, table td {{
-                    padding: 6px 13px;
-                    border: 1px solid #dfe2e5;
-                }}
-                table tr {{
-                    background-color: #fff;
-                    border-top: 1px solid #c6cbd1;
-                }}
-                table tr:nth-child(2n) {{
-                    background-color: #f6f8fa;
-                }}
-                blockquote {{
-                    padding: 0 1em;
-                    color: #6a737d;
-                    border-left: 0.25em solid #dfe2e5;
-                    margin: 0 0 16px 0;
-                }}
-                a {{
-                    color: #0366d6;
-                    text-decoration: none;
-                }}
-                a:hover {{
-                    text-decoration: underline;
-                }}
-                img {{
-                    max-width: 100%;
-                    box-sizing: content-box;
-                    background-color: #fff;
-                }}
-                .highlight {{
-                    margin: 16px 0;
-                }}
-            </style>
-        </head>
-        <body>
-            {content}
-        </body>
-        </html>
-        """
+        # Styles are parsed once for the document rather than with every page
+        if not self.document().defaultStyleSheet():
+            self.document().setDefaultStyleSheet(self._renderer.stylesheet())
+
+        html = self._renderer.cached_page(text)
+        pending = False
+        if html is None:
+            # Text added after a finished block renders on its own and is
+            # appended, keeping the layout of everything above it
+            if self._is_appended_block(text):
+                added = text[len(self._shown_text):]
+                self._shown_text = text
+                self._shown_html = None
+                fragment, _ = self._renderer.render_fragment(added)
+                self.append(fragment)
+                return
+            html, pending = self._renderer.render_page(text)
+
+        self._shown_text = text
+        self._awaiting_diagrams = pending
+        self._show_page(html)
+
+    def _show_page(self, html: str):
+        """Show a rendered page, leaving the document and scroll position alone if it is already shown"""
+        if html == self._shown_html:
+            return
+        self._shown_html = html
+        self.setHtml(html)
+
+    def _on_diagrams_ready(self):
+        """Render the shown page again once diagrams it was waiting for arrive"""
+        # Diagrams finishing together share one render, as does newer content
+        if self._awaiting_diagrams and not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _is_appended_block(self, text: str) -> bool:
+        """Check whether text only adds blocks that render the same on their own"""
+        shown = self._shown_text
+        if not shown or len(text) <= len(shown) or not text.startswith(shown):
+            return False
+        # The shown text must end after a blank line outside any code fence,
+        # and the addition must not continue a list, quote, table or code
+        # block above it. Reference definitions apply across the whole
+        # document, so neither part may contain one
+        if not shown.endswith('\n\n') or _ends_inside_fence(shown):
+            return False
+        added = text[len(shown):]
+        return (_APPENDABLE_START_RE.match(added) is not None
+                and _REFERENCE_DEF_RE.search(shown) is None
+                and _REFERENCE_DEF_RE.search(added) is None
+                and '```plantuml' not in added
+                and not self._awaiting_diagrams)